@@ -4,8 +4,10 @@ ArXiv scraper for collecting papers based on specified criteria.
 
 import asyncio
 import logging
+import re
+import sys
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import arxiv
 
 try:
@@ -15,6 +17,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_NAME_PREFIX = re.compile(r"^(?:Dr\.?|Prof\.?|Professor)\s+", re.IGNORECASE)
+
+
+def clean_author_name(name: str) -> str:
+    """Clean and normalize author name for lookups."""
+    return _RE_NAME_PREFIX.sub("", _RE_WHITESPACE.sub(" ", name.strip()))
+
 
 @dataclass
 class ArxivPaper:
@@ -31,12 +41,14 @@ class ArxivPaper:
     doi: str | None = None
     journal_ref: str | None = None
     comments: str | None = None
+    # Normalized author names, interned so repeated co-authors share one
+    # string object and lookups hit the fast identity path
+    cleaned_authors: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
-    def __hash__(self):
-        return hash(self.arxiv_id)
-
-    def __eq__(self, other):
-        return self.arxiv_id == other.arxiv_id
+    def __post_init__(self):
+        self.cleaned_authors = tuple(
+            sys.intern(clean_author_name(author)) for author in self.authors
+        )
 
 
 class ArxivScraper:
@@ -47,6 +59,8 @@ class ArxivScraper:
         self.client = arxiv.Client(
             page_size=100, delay_seconds=self.config.request_delay, num_retries=3
         )
+        # ArXiv rate-limits per IP, so keep category searches polite
+        self._category_semaphore = asyncio.Semaphore(2)
 
     async def search_papers(self) -> list[ArxivPaper]:
         """
@@ -55,17 +69,18 @@ class ArxivScraper:
         Returns:
             list of ArxivPaper objects matching the criteria.
         """
-        all_papers = []
-
-        for category in self.config.arxiv_categories:
-            logger.info(f"Searching category: {category}")
-            category_papers = await self._search_category(category)
-            all_papers.extend(category_papers)
-
-            # Add delay between categories to be respectful
-            await asyncio.sleep(self.config.request_delay)
+        category_results = await asyncio.gather(
+            *(
+                self._search_category(category)
+                for category in self.config.arxiv_categories
+            )
+        )
 
-        unique_papers = list(set(all_papers))
+        all_papers = [
+            paper for category_papers in category_results for paper in category_papers
+        ]
+        # Dedup by arxiv_id, keeping first-seen order for reproducibility
+        unique_papers = list({paper.arxiv_id: paper for paper in all_papers}.values())
         logger.info(f"Found {len(unique_papers)} unique papers across all categories")
 
         return unique_papers
@@ -103,6 +118,7 @@ class ArxivScraper:
 
     async def _search_category(self, category: str) -> list[ArxivPaper]:
         """Search for papers in a specific category."""
+        logger.info(f"Searching category: {category}")
         papers = []
 
         # Build date range query
@@ -121,19 +137,26 @@ class ArxivScraper:
                 sort_order=arxiv.SortOrder.Descending,
             )
 
-            # Get results
-            results = list(self.client.results(search))
-
-            # Convert results to ArxivPaper objects
-            for result in results:
-                paper = self._convert_result_to_paper(result)
-                if paper:
-                    papers.append(paper)
+            # Stream results and convert them as pages arrive. The arxiv
+            # client is synchronous, so run it in a thread to keep the event
+            # loop free.
+            def _collect() -> list[ArxivPaper]:
+                return [
+                    paper
+                    for paper in map(
+                        self._convert_result_to_paper, self.client.results(search)
+                    )
+                    if paper
+                ]
+
+            async with self._category_semaphore:
+                papers = await asyncio.to_thread(_collect)
 
         except Exception as e:
             logger.error(f"Error fetching papers for category {category}: {e}")
 
-        return papers[: self.config.max_papers_per_category]
+        # max_results already bounds the search, no need to re-slice
+        return papers
 
     def _convert_result_to_paper(self, result: arxiv.Result) -> ArxivPaper | None:
         """Convert arxiv.Result to ArxivPaper object."""
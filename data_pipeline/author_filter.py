@@ -4,21 +4,24 @@ Author filtering module for h-index based paper filtering.
 
 import asyncio
 import logging
+import os
+import sqlite3
 import time
-import requests  # type: ignore
+import aiohttp
 from dataclasses import dataclass
 
 try:
     from config import PipelineConfig
     from arxiv_scraper import ArxivPaper
-    from utils import clean_author_name
 except ImportError:
     from .config import PipelineConfig
     from .arxiv_scraper import ArxivPaper
-    from .utils import clean_author_name
 
 logger = logging.getLogger(__name__)
 
+# Cached author lookups stay valid for 30 days before being re-fetched
+AUTHOR_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
 
 @dataclass
 class AuthorInfo:
@@ -28,6 +31,48 @@ class AuthorInfo:
     affiliation: str | None = None
     hindex: int | None = None
     citations: int | None = None
+    author_id: str | None = None
+
+
+class TokenBucket:
+    """Async token bucket for pacing outgoing API requests.
+
+    Requests wait only when the budget is exhausted, instead of sleeping a
+    fixed delay before every call. The rate can be adjusted on the fly from
+    API rate-limit headers.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def update_from_headers(self, headers) -> None:
+        """Adapt the refill rate to the server-reported rate-limit budget."""
+        limit = headers.get("x-ratelimit-limit")
+        remaining = headers.get("x-ratelimit-remaining")
+        try:
+            if limit is not None and remaining is not None:
+                # Spend the remaining budget evenly over a one-minute window
+                self.rate = max(float(remaining) / 60.0, 0.1)
+        except ValueError:
+            pass
 
 
 class AuthorFilter:
@@ -36,6 +81,87 @@ class AuthorFilter:
     def __init__(self, config: PipelineConfig):
         self.config = config
         self._author_cache: dict[str, AuthorInfo] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._request_gate = asyncio.Semaphore(8)
+        self._rate_limiter = TokenBucket(
+            rate=1.0 / max(config.request_delay, 0.01), burst=8
+        )
+        os.makedirs(config.output_dir, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(config.output_dir, "authors.db"), isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS authors ("
+            "author_name TEXT PRIMARY KEY, "
+            "hindex INT, citations INT, affiliation TEXT, fetched_at INT, "
+            "author_id TEXT)"
+        )
+        try:
+            self._db.execute("ALTER TABLE authors ADD COLUMN author_id TEXT")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        # TTL-expired entries whose Semantic Scholar ID is known; these can
+        # be refreshed in bulk via the author/batch endpoint
+        self._expired_author_ids: dict[str, str] = {}
+        self._load_cached_authors()
+
+    def _load_cached_authors(self) -> None:
+        """Warm the in-memory cache from the on-disk author database."""
+        cutoff = int(time.time()) - AUTHOR_CACHE_TTL_SECONDS
+        rows = self._db.execute(
+            "SELECT author_name, hindex, citations, affiliation, fetched_at, "
+            "author_id FROM authors"
+        )
+        for author_name, hindex, citations, affiliation, fetched_at, author_id in rows:
+            if fetched_at >= cutoff:
+                self._author_cache[author_name] = AuthorInfo(
+                    name=author_name,
+                    hindex=hindex,
+                    citations=citations,
+                    affiliation=affiliation,
+                    author_id=author_id,
+                )
+            elif author_id:
+                self._expired_author_ids[author_name] = author_id
+        if self._author_cache:
+            logger.info(f"Loaded {len(self._author_cache)} cached author lookups")
+
+    def _store_cached_author(self, author_name: str, author_info: AuthorInfo) -> None:
+        """Persist a lookup result so warm re-runs skip the network entirely."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO authors VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                author_name,
+                author_info.hindex,
+                author_info.citations,
+                author_info.affiliation,
+                int(time.time()),
+                author_info.author_id,
+            ),
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session so connections are pooled."""
+        if self._session is None or self._session.closed:
+            # Long keep-alives and cached DNS avoid paying the TCP+TLS
+            # handshake on every request
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=8,
+                    limit=64,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session and the on-disk author cache."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._db.close()
 
     async def filter_papers_by_author_hindex(
         self, papers: list[ArxivPaper]
@@ -49,21 +175,41 @@ class AuthorFilter:
         Returns:
             Filtered list of papers where at least one author meets h-index criteria
         """
-        filtered_papers: list[ArxivPaper] = []
+        semaphore = asyncio.Semaphore(self.config.concurrent_requests)
 
-        for paper in papers:
-            try:
-                meets_criteria = await self._paper_meets_hindex_criteria(paper)
-                if meets_criteria:
-                    filtered_papers.append(paper)
+        # Warm the cache for each distinct author once; co-authors cluster
+        # across papers, so the per-paper checks below become cache hits
+        unique_authors = {
+            author for paper in papers for author in paper.cleaned_authors
+        }
 
-                await asyncio.sleep(self.config.request_delay)
+        # Refresh expired cached authors in bulk where their IDs are known,
+        # then fall back to per-name search for the rest
+        await self._refresh_expired_authors(unique_authors)
 
-            except Exception as e:
-                logger.warning(
-                    f"Error checking h-index for paper {paper.arxiv_id}: {e}"
-                )
-                continue
+        async def prefetch_author(author_name: str) -> None:
+            async with semaphore:
+                try:
+                    await self._get_author_info(author_name)
+                except Exception as e:
+                    logger.debug(f"Prefetch failed for {author_name}: {e}")
+
+        await asyncio.gather(*(prefetch_author(name) for name in unique_authors))
+
+        async def check_paper(paper: ArxivPaper) -> bool:
+            async with semaphore:
+                try:
+                    return await self._paper_meets_hindex_criteria(paper)
+                except Exception as e:
+                    logger.warning(
+                        f"Error checking h-index for paper {paper.arxiv_id}: {e}"
+                    )
+                    return False
+
+        results = await asyncio.gather(*(check_paper(paper) for paper in papers))
+        filtered_papers = [
+            paper for paper, meets_criteria in zip(papers, results) if meets_criteria
+        ]
 
         logger.info(
             f"Filtered {len(papers)} papers to {len(filtered_papers)} based on h-index criteria"
@@ -71,18 +217,28 @@ class AuthorFilter:
         return filtered_papers
 
     async def _paper_meets_hindex_criteria(self, paper: ArxivPaper) -> bool:
-        """Check if a paper meets the h-index criteria."""
-        tasks = [self._get_author_info(author_name) for author_name in paper.authors]
-        author_infos = await asyncio.gather(*tasks, return_exceptions=True)
+        """Check if a paper meets the h-index criteria.
 
-        for author_info in author_infos:
-            if isinstance(author_info, Exception):
-                continue
-            assert isinstance(author_info, AuthorInfo)
-            if author_info and author_info.hindex is not None:
-                if self._author_meets_criteria(author_info):
-                    return True
-        return False
+        Returns as soon as any author passes, cancelling the remaining
+        lookups — cached authors resolve instantly.
+        """
+        tasks = [
+            asyncio.ensure_future(self._get_author_info(author_name))
+            for author_name in paper.cleaned_authors
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    author_info = await future
+                except Exception:
+                    continue
+                if author_info and author_info.hindex is not None:
+                    if self._author_meets_criteria(author_info):
+                        return True
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
 
     def _author_meets_criteria(self, author_info: AuthorInfo) -> bool:
         """Check if an author meets the h-index criteria."""
@@ -98,28 +254,34 @@ class AuthorFilter:
         return True
 
     async def _get_author_info(self, author_name: str) -> AuthorInfo | None:
-        """Get author information including h-index."""
-        clean_name = clean_author_name(author_name)
-        if clean_name in self._author_cache:
-            return self._author_cache[clean_name]
+        """Get author information including h-index.
+
+        Callers pass names already normalized via clean_author_name
+        (papers carry them precomputed on cleaned_authors).
+        """
+        if author_name in self._author_cache:
+            return self._author_cache[author_name]
         author_info = None
 
         try:
-            author_info = await self._get_author_from_google_scholar(clean_name)
+            author_info = await self._get_author_from_google_scholar(author_name)
         except Exception as e:
-            logger.debug(f"Google Scholar lookup failed for {clean_name}: {e}")
+            logger.debug(f"Google Scholar lookup failed for {author_name}: {e}")
 
         # If Google Scholar fails, try Semantic Scholar
         if not author_info or author_info.hindex is None:
             try:
-                semantic_info = await self._get_author_from_semantic_scholar(clean_name)
+                semantic_info = await self._get_author_from_semantic_scholar(
+                    author_name
+                )
                 if semantic_info and semantic_info.hindex is not None:
                     author_info = semantic_info
             except Exception as e:
-                logger.debug(f"Semantic Scholar lookup failed for {clean_name}: {e}")
+                logger.debug(f"Semantic Scholar lookup failed for {author_name}: {e}")
 
-        author_info = author_info or AuthorInfo(name=clean_name, hindex=None)
-        self._author_cache[clean_name] = author_info
+        author_info = author_info or AuthorInfo(name=author_name, hindex=None)
+        self._author_cache[author_name] = author_info
+        self._store_cached_author(author_name, author_info)
         return author_info
 
     async def _get_author_from_google_scholar(
@@ -135,40 +297,110 @@ class AuthorFilter:
     ) -> AuthorInfo | None:
         """Get author information from Semantic Scholar API."""
         try:
-            # Sleep to avoid rate limiting
-            time.sleep(3)
             # Semantic Scholar API endpoint
             url = "https://api.semanticscholar.org/graph/v1/author/search"
             params = {
                 "query": author_name,
-                "limit": 1,
+                "limit": "1",
                 "fields": "name,hIndex,citationCount,affiliations",
             }
 
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            data = await self._request_json(url, params)
 
-            data = response.json()
             if data.get("data") and len(data["data"]) > 0:
-                author_data = data["data"][0]
-
-                # Extract affiliation
-                affiliation = None
-                if author_data.get("affiliations"):
-                    affiliation = (
-                        author_data["affiliations"][0]
-                        if author_data["affiliations"]
-                        else None
-                    )
-
-                return AuthorInfo(
-                    name=author_data.get("name", author_name),
-                    hindex=author_data.get("hIndex"),
-                    citations=author_data.get("citationCount"),
-                    affiliation=affiliation,
-                )
+                return self._author_info_from_payload(data["data"][0], author_name)
 
         except Exception as e:
             logger.warning(f"Semantic Scholar API error for {author_name}: {e}")
 
         return None
+
+    @staticmethod
+    def _author_info_from_payload(author_data: dict, author_name: str) -> AuthorInfo:
+        """Build an AuthorInfo from a Semantic Scholar author payload."""
+        affiliation = None
+        if author_data.get("affiliations"):
+            affiliation = author_data["affiliations"][0]
+
+        return AuthorInfo(
+            name=author_data.get("name", author_name),
+            hindex=author_data.get("hIndex"),
+            citations=author_data.get("citationCount"),
+            affiliation=affiliation,
+            author_id=author_data.get("authorId"),
+        )
+
+    async def _refresh_expired_authors(self, author_names: set[str]) -> None:
+        """Bulk-refresh TTL-expired cache entries via the author/batch endpoint.
+
+        Names whose Semantic Scholar ID is already on disk can be re-fetched
+        1000 at a time instead of one author/search call each.
+        """
+        names = [name for name in author_names if name in self._expired_author_ids]
+        if not names:
+            return
+
+        url = "https://api.semanticscholar.org/graph/v1/author/batch"
+        params = {"fields": "name,hIndex,citationCount,affiliations"}
+        for start in range(0, len(names), 1000):
+            batch_names = names[start : start + 1000]
+            batch_ids = [self._expired_author_ids[name] for name in batch_names]
+            try:
+                results = await self._post_json(url, params, {"ids": batch_ids})
+            except Exception as e:
+                logger.warning(f"Semantic Scholar batch lookup failed: {e}")
+                continue
+            for name, author_data in zip(batch_names, results):
+                if not author_data:
+                    continue
+                author_info = self._author_info_from_payload(author_data, name)
+                self._author_cache[name] = author_info
+                self._store_cached_author(name, author_info)
+                self._expired_author_ids.pop(name, None)
+
+    async def _request_json(self, url: str, params: dict) -> dict:
+        """Issue a rate-limited GET request, retrying with backoff on 429s."""
+        session = await self._get_session()
+        backoff = 1.0
+        for _ in range(5):
+            await self._rate_limiter.acquire()
+            async with self._request_gate:
+                async with session.get(
+                    url, params=params, timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    if response.status == 429:
+                        retry_after = float(
+                            response.headers.get("retry-after", backoff)
+                        )
+                        await asyncio.sleep(retry_after)
+                        backoff *= 2
+                        continue
+                    response.raise_for_status()
+                    self._rate_limiter.update_from_headers(response.headers)
+                    return await response.json()
+        raise RuntimeError(f"Rate limited after retries: {url}")
+
+    async def _post_json(self, url: str, params: dict, payload: dict):
+        """Issue a rate-limited POST request, retrying with backoff on 429s."""
+        session = await self._get_session()
+        backoff = 1.0
+        for _ in range(5):
+            await self._rate_limiter.acquire()
+            async with self._request_gate:
+                async with session.post(
+                    url,
+                    params=params,
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=30),
+                ) as response:
+                    if response.status == 429:
+                        retry_after = float(
+                            response.headers.get("retry-after", backoff)
+                        )
+                        await asyncio.sleep(retry_after)
+                        backoff *= 2
+                        continue
+                    response.raise_for_status()
+                    self._rate_limiter.update_from_headers(response.headers)
+                    return await response.json()
+        raise RuntimeError(f"Rate limited after retries: {url}")
@@ -61,6 +61,7 @@ class PipelineConfig:
     # ])
     # Output settings
     output_dir: str = os.getcwd() + "/outputs"
+    output_format: str = "csv"  # "csv" or "parquet" for intermediate dataframes
     save_raw_papers: bool = True
     save_extracted_sections: bool = True
     save_citations: bool = True
@@ -68,3 +69,4 @@ class PipelineConfig:
     # Processing settings
     concurrent_requests: int = 5  # Number of concurrent API requests
     request_delay: float = 1.0  # Delay between requests (seconds)
+    fail_fast: bool = True  # Re-raise save errors instead of continuing
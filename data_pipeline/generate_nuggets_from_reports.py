@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import csv
 import json
 import logging
 import os
@@ -7,10 +9,88 @@ import datetime
 import pandas as pd
 
 from nuggetizer.core.types import Query, Document, Request
-from nuggetizer.models.nuggetizer import Nuggetizer
+from nuggetizer.models.async_nuggetizer import AsyncNuggetizer
 from nuggetizer.core.metrics import calculate_nugget_scores
 
 
+async def _run_nuggetizer_batched(
+    nuggetizer: AsyncNuggetizer,
+    requests: list[Request],
+    contexts: list[str],
+    concurrency: int,
+):
+    """Run all create calls, then all assign calls, with bounded concurrency.
+
+    Failures are returned in place of results so one bad paper does not
+    abort the whole batch mid-flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Released nuggetizer builds (<= 0.0.5) expose ``async def create`` /
+    # ``async def assign``; the in-tree eval/nuggetizer package names the
+    # coroutines ``async_create`` / ``async_assign`` and keeps blocking
+    # wrappers under the released names. Resolve once, preferring the
+    # ``async_*`` spelling so a blocking wrapper is never awaited from
+    # inside the running loop.
+    create = getattr(nuggetizer, "async_create", None) or nuggetizer.create
+    assign = getattr(nuggetizer, "async_assign", None) or nuggetizer.assign
+
+    async def create_one(request):
+        async with semaphore:
+            return await create(request)
+
+    scored_lists = await asyncio.gather(
+        *(create_one(request) for request in requests), return_exceptions=True
+    )
+
+    async def assign_one(request, context, scored_nuggets):
+        if isinstance(scored_nuggets, Exception):
+            return scored_nuggets
+        async with semaphore:
+            return await assign(request.query.text, context, scored_nuggets)
+
+    assigned_lists = await asyncio.gather(
+        *(
+            assign_one(request, context, scored_nuggets)
+            for request, context, scored_nuggets in zip(
+                requests, contexts, scored_lists
+            )
+        ),
+        return_exceptions=True,
+    )
+    return scored_lists, assigned_lists
+
+
+def process_paper(arxiv_id, query_text, qid, assigned_nuggets) -> dict:
+    """Build the output record (nugget dicts + metrics) for one paper."""
+    # Build the nugget dicts once and reuse them for filtering,
+    # metrics and output
+    nugget_list = [
+        {"text": n.text, "importance": n.importance, "assignment": n.assignment}
+        for n in assigned_nuggets
+    ]
+    valid_nuggets = [d for d in nugget_list if d["assignment"] == "support"]
+    partial_nuggets = [
+        d for d in nugget_list if d["assignment"] in ["partial_support", "support"]
+    ]
+
+    metrics = calculate_nugget_scores(qid, nugget_list)
+
+    return {
+        "qid": arxiv_id,
+        "query": query_text,
+        "nuggets": nugget_list,
+        "supported_nuggets": valid_nuggets,
+        "partially_supported_nuggets": partial_nuggets,
+        "nuggets_metrics": {
+            "strict_vital_score": metrics.strict_vital_score,
+            "strict_all_score": metrics.strict_all_score,
+            "vital_score": metrics.vital_score,
+            "all_score": metrics.all_score,
+        },
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate nuggets from ground truth reports"
@@ -30,15 +110,28 @@ def main():
         default=0,
         help="Log level (0=warning, 1=info, 2=debug)",
     )
+    parser.add_argument(
+        "--concurrent_requests",
+        type=int,
+        default=8,
+        help="Number of concurrent nuggetizer LLM calls",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.WARNING - 10 * args.log_level)
     logger = logging.getLogger(__name__)
 
-    # Read the CSV file
+    # Read only the columns the loop consumes, with pinned dtypes so the
+    # parser skips inference over the (wide) remaining columns
     data_path = "../../../scraped_data/20250607_180022/papers_with_related_works.csv"
     logger.info(f"Loading data from {data_path}")
-    df = pd.read_csv(data_path)
+    df = pd.read_csv(
+        data_path,
+        usecols=["arxiv_id", "abstract", "clean_latex_related_works"],
+        dtype="string",
+        engine="c",
+        memory_map=True,
+    )
     logger.info(f"Loaded {len(df)} rows from CSV")
 
     # Create output directory
@@ -50,109 +143,85 @@ def main():
         config_file.write(f"model: {args.model}\n")
         config_file.write(f"date: {datetime.datetime.now().strftime('%Y-%m-%d')}\n")
 
-    nuggetizer = Nuggetizer(model=args.model, log_level=args.log_level)
-
-    for i, row in df.iterrows():
-        arxiv_id = row.get("arxiv_id", f"paper_{i}")
-        abstract = row.get("abstract", "")
-        related_works = row.get("clean_latex_related_works", "")
-
-        if pd.isna(related_works) or related_works == "":
+    nuggetizer = AsyncNuggetizer(model=args.model, log_level=args.log_level)
+
+    # One buffered CSV stream and one JSONL stream for all papers instead of
+    # a directory with two files per row
+    csv_path = os.path.join(args.output_dir, "res.csv")
+    csv_file = open(csv_path, "w", newline="", buffering=1024 * 1024)
+    csv_writer: csv.DictWriter | None = None
+    jsonl_path = os.path.join(args.output_dir, "res.jsonl")
+    jsonl_file = open(jsonl_path, "w", encoding="utf-8", buffering=1024 * 1024)
+
+    # Pull the consumed columns out once; iterrows boxes every row into a
+    # Series, which dominates the loop for wide frames
+    has_related_works = (
+        df["clean_latex_related_works"].notna() & (df["clean_latex_related_works"] != "")
+    ).to_numpy()
+
+    # Build one request per usable row, then fan the LLM calls out in two
+    # batched phases (create, then assign) instead of 2N serial round-trips
+    pending = []
+    for i, (arxiv_id, abstract, related_works) in enumerate(
+        zip(df["arxiv_id"], df["abstract"], df["clean_latex_related_works"])
+    ):
+        if not has_related_works[i]:
             logger.warning(f"Skipping row {i} - no related works content")
             continue
 
-        # Create query and request
         query_text = f"Write a Related Works section for an academic paper given the paper's abstract. Here is the paper abstract:\n{abstract}"
         documents = [Document(docid=f"{arxiv_id}_related_works", segment=related_works)]
         query = Query(qid=arxiv_id, text=query_text)
-        request = Request(query=query, documents=documents)
+        pending.append((i, arxiv_id, related_works, Request(query=query, documents=documents)))
+
+    scored_lists, assigned_lists = asyncio.run(
+        _run_nuggetizer_batched(
+            nuggetizer,
+            [request for _, _, _, request in pending],
+            [related_works for _, _, related_works, _ in pending],
+            args.concurrent_requests,
+        )
+    )
 
+    for (i, arxiv_id, related_works, request), scored_nuggets, assigned_nuggets in zip(
+        pending, scored_lists, assigned_lists
+    ):
+        query_text = request.query.text
         logger.info(f"Processing paper {i + 1}/{len(df)}: {arxiv_id}")
         try:
-            # Generate and assign nuggets
-            scored_nuggets = nuggetizer.create(request)
+            if isinstance(scored_nuggets, Exception):
+                raise scored_nuggets
+            if isinstance(assigned_nuggets, Exception):
+                raise assigned_nuggets
             logger.info(f"Generated {len(scored_nuggets)} nuggets for {arxiv_id}")
 
-            assigned_nuggets = nuggetizer.assign(
-                query_text, related_works, scored_nuggets
+            output = process_paper(
+                arxiv_id, query_text, request.query.qid, assigned_nuggets
             )
 
-            # Filter nuggets by assignment type
-            valid_nuggets = [n for n in assigned_nuggets if n.assignment == "support"]
-            partial_nuggets = [
-                n
-                for n in assigned_nuggets
-                if n.assignment in ["partial_support", "support"]
-            ]
-
             logger.info(
-                f"Kept {len(valid_nuggets)} valid nuggets out of {len(scored_nuggets)} for {arxiv_id}"
+                f"Kept {len(output['supported_nuggets'])} valid nuggets out of "
+                f"{len(scored_nuggets)} for {arxiv_id}"
             )
 
-            # Calculate metrics
-            nugget_list = [
-                {"text": n.text, "importance": n.importance, "assignment": n.assignment}
-                for n in assigned_nuggets
-            ]
-            metrics = calculate_nugget_scores(request.query.qid, nugget_list)
-
-            # Prepare output
-            output = {
-                "qid": arxiv_id,
-                "query": query_text,
-                "nuggets": [
-                    {
-                        "text": n.text,
-                        "importance": n.importance,
-                        "assignment": n.assignment,
-                    }
-                    for n in assigned_nuggets
-                ],
-                "supported_nuggets": [
-                    {
-                        "text": n.text,
-                        "importance": n.importance,
-                        "assignment": n.assignment,
-                    }
-                    for n in valid_nuggets
-                ],
-                "partially_supported_nuggets": [
-                    {
-                        "text": n.text,
-                        "importance": n.importance,
-                        "assignment": n.assignment,
-                    }
-                    for n in partial_nuggets
-                ],
-                "nuggets_metrics": {
-                    "strict_vital_score": metrics.strict_vital_score,
-                    "strict_all_score": metrics.strict_all_score,
-                    "vital_score": metrics.vital_score,
-                    "all_score": metrics.all_score,
-                },
-            }
-
-            # Save output files
-            row_id = str(i)
-            row_dir = os.path.join(args.output_dir, row_id)
-            os.makedirs(row_dir, exist_ok=True)
-
-            # Save JSON
-            json_path = os.path.join(row_dir, "res.json")
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, ensure_ascii=False, indent=2)
-
-            # Save CSV
-            csv_path = os.path.join(row_dir, "res.csv")
-            output_df = pd.DataFrame([output])
-            output_df.to_csv(csv_path, index=False)
-
-            logger.info(f"Logged output for {row_id} to {json_path}")
+            # Append one JSON line per paper
+            jsonl_file.write(json.dumps(output, ensure_ascii=False))
+            jsonl_file.write("\n")
+
+            # Append to the shared CSV stream
+            if csv_writer is None:
+                csv_writer = csv.DictWriter(csv_file, fieldnames=list(output.keys()))
+                csv_writer.writeheader()
+            csv_writer.writerow(output)
+
+            logger.info(f"Logged output for row {i} to {jsonl_path}")
 
         except Exception as e:
             logger.error(f"Failed to process {arxiv_id}: {e}")
-            exit()
+            continue
 
+    csv_file.close()
+    jsonl_file.close()
     logger.info(f"Writing output to {args.output_dir}")
     logger.info("Done.")
 
@@ -1,8 +1,14 @@
 import argparse
+import os
+import numpy as np
 import pandas as pd
 import lotus
 from lotus.models import LM
 
+# Rows judged per sem_filter call; amortizes per-call overhead without
+# building one giant batch
+SEM_FILTER_CHUNK_SIZE = 256
+
 
 query_in = "Carefully read the {title}, {abstract} and {related_work_section} of an academic paper. \
     Then consider the cited paper in question, given the title {cited_paper_title}, the {cited_paper_authors} and a snippet of its content, {cited_paper_content}.\
@@ -13,9 +19,10 @@ query_in = "Carefully read the {title}, {abstract} and {related_work_section} of
     Alternatively, a non-important reference may be a relevant reference that reflects an important topic area, but the particular reference could be omitted or substituted with a different related work."
 
 
-def get_important_citations(
+def prepare_joined_df(
     citation_df: pd.DataFrame, related_works_df: pd.DataFrame
 ) -> pd.DataFrame:
+    """Merge citations with related-works sections into the frame sem_filter consumes."""
     joined_df = citation_df.merge(
         related_works_df, left_on="parent_paper_title", right_on="title", how="left"
     )
@@ -27,18 +34,85 @@ def get_important_citations(
         }
     )
 
-    joined_df["cited_paper_content"] = joined_df.apply(
-        lambda row: row["cited_paper_abstract"]
-        if row.get("is_arxiv_paper", False)
-        else row.get("search_res_content", None),
-        axis=1,
+    if "is_arxiv_paper" in joined_df.columns:
+        is_arxiv = joined_df["is_arxiv_paper"].fillna(False).to_numpy(dtype=bool)
+    else:
+        is_arxiv = np.zeros(len(joined_df), dtype=bool)
+    if "search_res_content" in joined_df.columns:
+        search_content = joined_df["search_res_content"].to_numpy()
+    else:
+        search_content = np.full(len(joined_df), None)
+    joined_df["cited_paper_content"] = np.where(
+        is_arxiv, joined_df["cited_paper_abstract"].to_numpy(), search_content
     )
-    res = joined_df.sem_filter(query_in)
+    return joined_df
+
+
+def get_important_citations(
+    citation_df: pd.DataFrame, related_works_df: pd.DataFrame
+) -> pd.DataFrame:
+    return filter_important_citations(prepare_joined_df(citation_df, related_works_df))
+
+
+# Columns referenced by query_in; everything else is dead weight in the
+# per-row prompt construction
+QUERY_COLUMNS = [
+    "title",
+    "abstract",
+    "related_work_section",
+    "cited_paper_title",
+    "cited_paper_authors",
+    "cited_paper_content",
+]
+
+
+def filter_important_citations(joined_df: pd.DataFrame) -> pd.DataFrame:
+    # Rows without content cannot be judged, so drop them before prompting
+    judgeable_df = joined_df[joined_df["cited_paper_content"].notna()]
+
+    if len(judgeable_df) == 0:
+        res = judgeable_df
+    else:
+        # Project down to the prompt columns, then re-attach the full rows
+        # of the kept citations by index
+        projected_df = judgeable_df[QUERY_COLUMNS]
+        chunks = [
+            projected_df.iloc[i : i + SEM_FILTER_CHUNK_SIZE]
+            for i in range(0, len(projected_df), SEM_FILTER_CHUNK_SIZE)
+        ]
+        kept = pd.concat([chunk.sem_filter(query_in) for chunk in chunks])
+        res = judgeable_df.loc[kept.index]
     print_stats(res, joined_df)
 
     return res
 
 
+def load_joined_df(
+    citation_input_file: str,
+    related_works_input_file: str,
+    cache_file: str | None,
+) -> pd.DataFrame:
+    """Load the merged citation frame, reusing a Parquet cache when fresh.
+
+    Re-runs skip the CSV parsing and merge entirely when the cache is newer
+    than both input files.
+    """
+    if cache_file and os.path.exists(cache_file):
+        inputs_mtime = max(
+            os.path.getmtime(citation_input_file),
+            os.path.getmtime(related_works_input_file),
+        )
+        if os.path.getmtime(cache_file) >= inputs_mtime:
+            return pd.read_parquet(cache_file)
+
+    citation_df = pd.read_csv(citation_input_file)
+    related_works_df = pd.read_csv(related_works_input_file)
+    joined_df = prepare_joined_df(citation_df, related_works_df)
+    if cache_file:
+        joined_df.to_parquet(cache_file)
+    return joined_df
+
+
 def print_stats(df: pd.DataFrame, joined_df: pd.DataFrame):
     print(f"Total num cites: {len(joined_df)}")
     print(
@@ -85,12 +159,21 @@ if __name__ == "__main__":
         required=True,
         help="Path to the output file",
     )
+    parser.add_argument(
+        "--joined_cache_file",
+        type=str,
+        default=None,
+        help="Optional Parquet path for caching the merged frame across runs",
+    )
 
     args = parser.parse_args()
 
     lotus.settings.configure(lm=LM(model=args.model))
 
-    citation_df = pd.read_csv(args.citation_input_file)
-    related_works_df = pd.read_csv(args.related_works_input_file)
-    important_citations_df = get_important_citations(citation_df, related_works_df)
+    joined_df = load_joined_df(
+        args.citation_input_file,
+        args.related_works_input_file,
+        args.joined_cache_file,
+    )
+    important_citations_df = filter_important_citations(joined_df)
     important_citations_df.to_csv(args.output_file, index=False)
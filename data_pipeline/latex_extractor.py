@@ -3,17 +3,23 @@ LaTeX content extractor for downloading ArXiv source files and extracting relate
 """
 
 import asyncio
+import csv
+import hashlib
+import io
+import json
 import logging
 import re
+import sqlite3
 import tarfile
 import tempfile
+import time
 import os
-from pathlib import Path
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
-import requests  # type: ignore
-import pandas as pd
+import aiohttp
 
 try:
     import PyPDF2
@@ -33,6 +39,235 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Hot regexes compiled once at import time; these run on every paper, so
+# recompiling them per call would dominate the extraction phase.
+_RE_COMMENT = re.compile(r"%.*$", re.MULTILINE)
+# One alternation covers figure/figure*/subfigure/subfigure*; the
+# backreference keeps begin/end tags paired
+_RE_FIGURE = re.compile(
+    r"\\begin\{(figure\*?|subfigure\*?)\}.*?\\end\{\1\}", re.DOTALL
+)
+_RE_LABEL = re.compile(r"\\label\{[^}]*\}\n?")
+_RE_BIBTEX_ENTRY = re.compile(
+    r"@\w+\s*\{\s*([^,\s]+)\s*,(.*?)(?=@\w+\s*\{|\Z)", re.DOTALL | re.IGNORECASE
+)
+# Matches \cite, \citep, \citet, starred forms and optional [..] arguments
+_RE_CITE = re.compile(r"\\cite[a-zA-Z]*\*?(?:\[[^\]]*\]){0,2}\*?\{([^}]+)\}")
+_RE_INLINE_CITE = re.compile(r"\(([^)]*(?:\d{4})[^)]*)\)")
+_RE_INPUT = re.compile(r"\\input\{([^}]+)\}", re.IGNORECASE)
+# Splitting on section headers yields [prelude, title1, body1, title2, ...]
+# in one linear pass; a `(.*?)(?=\\section|\Z)` lookahead backtracks
+# quadratically on long files.
+_RE_SECTION_SPLIT = re.compile(r"\\section\*?\{([^}]+)\}")
+
+# Project file types worth keeping for section and bibliography lookup
+_PROJECT_FILE_EXTENSIONS = (".tex", ".bib", ".bbx", ".bst", ".cls", ".sty", ".bbl")
+
+# Filename keywords suggesting a file holds related-works content; one
+# compiled alternation beats looping substring checks per filename
+_RE_RELATED_KEYWORD = re.compile(
+    r"related[_-]?work|background|literature|survey|prior|previous|review"
+)
+
+# Citation search-term and title-matching helpers
+_RE_YEAR = re.compile(r"\b(19|20)\d{2}\b")
+_RE_FOUR_DIGITS = re.compile(r"\d{4}")
+_RE_NON_ALPHA = re.compile(r"[^a-zA-Z]")
+_RE_WORD2 = re.compile(r"\b[a-zA-Z]{2,}\b")
+_RE_WORD3 = re.compile(r"\b\w{3,}\b")
+_RE_BIB_TITLE = re.compile(r'["\'\`\{]([^"\'`\}]{10,})["\'\`\}]')
+_RE_BIB_SPLIT = re.compile(r"[.,;]")
+
+# PDF section-boundary heuristics; these run per line of extracted PDF text
+_RE_PDF_SENTENCE = re.compile(r"(?:\d*[a-zA-Z]+\d*)+\.\s+[a-zA-Z]")
+_RE_PDF_SECTION_HEADER = re.compile(
+    r"\.?\s*(\d+\.?\s+[A-Z](?:[a-z]|[A-Z]|\s+[A-Z])[^.]*?)(?:\s|$)"
+)
+_RE_PDF_SUBSECTION_HEADER = re.compile(
+    r"\.?\s*(\d+\.\d+\s+[A-Z](?:[a-z]|[A-Z])[^.]*?)(?:\s|$)"
+)
+_RE_PDF_NUMBERED_SECTION = re.compile(r"^\d+(?!\.\d)\s+[A-Z][a-z]\n")
+# Words that open section headers; a tuple lets str.startswith test all of
+# them in one C call
+_SECTION_START_WORDS = (
+    "method",
+    "approach",
+    "experiment",
+    "evaluation",
+    "result",
+    "discussion",
+    "conclusion",
+    "implementation",
+)
+_RE_PDF_CLEAR_SECTION = re.compile(
+    r"^(?:methodology?|approach?|experiments?|evaluation|results?|discussion"
+    r"|conclusions?|implementation|future work|acknowledgments?|references?"
+    r"|bibliography?|appendix|limitations?|author contributions?)$"
+)
+_RE_PARAGRAPH_BREAKS = re.compile(r"\n\s*\n")
+_RE_HORIZONTAL_SPACE = re.compile(r"[ \t]+")
+
+# A `%` starts a comment unless escaped by an odd number of backslashes: the
+# pattern anchors on a non-backslash (or start of text/line) followed by
+# complete backslash pairs, then swallows trailing spaces and the comment.
+# Replacing with the anchor group reproduces the old per-character scan,
+# including its rstrip of whitespace before the comment.
+_RE_UNESCAPED_COMMENT = re.compile(r"((?:^|[^\\])(?:\\\\)*)[ \t]*%[^\n]*")
+
+# arXiv identifiers embedded in bibliography url/doi fields; both new-style
+# (2301.12345) and old-style (cs/0112017) IDs are accepted
+_RE_ARXIV_ID_URL = re.compile(
+    r"arxiv\.org/(?:abs|pdf)/([0-9]{4}\.[0-9]{4,5}(?:v\d+)?|[a-z-]+/\d{7})",
+    re.IGNORECASE,
+)
+_RE_ARXIV_ID_DOI = re.compile(
+    r"10\.48550/arxiv\.([0-9]{4}\.[0-9]{4,5})", re.IGNORECASE
+)
+_RE_ARXIV_ID_VERSION = re.compile(r"v\d+$")
+
+# Cached arXiv API responses go stale slowly; a week balances freshness
+# against re-querying the same citations on every run
+ARXIV_QUERY_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM_ID = f"{{{_ATOM_NS}}}id"
+_ATOM_TITLE = f"{{{_ATOM_NS}}}title"
+_ATOM_SUMMARY = f"{{{_ATOM_NS}}}summary"
+_ATOM_LINK = f"{{{_ATOM_NS}}}link"
+
+
+def _parse_atom_entry(entry: ET.Element) -> Dict[str, str]:
+    """Collect the fields used downstream in one walk over an entry's children.
+
+    Separate ``find``/``findall`` calls each rescan the child list; a single
+    iteration picks up id, title, summary and the alternate link together.
+    """
+    entry_id = ""
+    title = ""
+    abstract = ""
+    abs_url = ""
+    for child in entry:
+        tag = child.tag
+        if tag == _ATOM_ID:
+            entry_id = (child.text or "").strip()
+        elif tag == _ATOM_TITLE:
+            title = (child.text or "").strip()
+        elif tag == _ATOM_SUMMARY:
+            abstract = (child.text or "").strip()
+        elif tag == _ATOM_LINK and not abs_url and child.get("rel") == "alternate":
+            abs_url = child.get("href", "")
+    return {"id": entry_id, "title": title, "abstract": abstract, "abs_url": abs_url}
+
+
+def _iter_atom_entries(body: str):
+    """Yield ``<entry>`` elements from an arXiv Atom feed as they are parsed.
+
+    Streams with ``ET.iterparse`` instead of materializing the whole tree
+    with ``fromstring``; each entry is cleared once the consumer moves on,
+    so peak memory stays flat for large batched responses.
+    """
+    for _event, element in ET.iterparse(io.StringIO(body)):
+        if element.tag == f"{{{_ATOM_NS}}}entry":
+            yield element
+            element.clear()
+
+
+@lru_cache(maxsize=4096)
+def _clean_latex_content_cached(content: str) -> str:
+    """Clean LaTeX content by removing common commands and formatting.
+
+    Memoized at module scope: bibliography fields repeat the same short
+    values (journal names, author lists) across entries, so repeat inputs
+    skip the substitution passes entirely.
+    """
+    # Remove comments
+    content = _RE_COMMENT.sub("", content)
+
+    # Remove figures and their content in a single pass
+    content = _RE_FIGURE.sub("", content)
+
+    # Remove common LaTeX commands but keep the text, preserving citation commands
+    # content = re.sub(r'\\[a-zA-Z]+\*?\{([^}]*)\}(?!\s*\\cite\{|\s*\\citep\{)', r'\1', content)  # Don't remove \cite{} or \citep{}
+    # content = re.sub(r'\\[a-zA-Z]+\*?\[[^\]]*\]\{([^}]*)\}(?!\s*\\cite\{|\s*\\citep\{)', r'\1', content)  # Don't remove \cite{} or \citep{}
+    # content = re.sub(r'(?!\\cite|\\citep)\\\([a-zA-Z]+\*?\{([^}]*)\}', r'\1', content)
+    # content = re.sub(r'(?!\\cite|\\citep)\\\([a-zA-Z]+\*?\[[^\]]*\]\{([^}]*)\}', r'\1', content)
+
+    # # Remove standalone commands
+    # content = re.sub(r'\\[a-zA-Z]+\*?', '', content)
+
+    # Remove labels and possible newline
+    content = _RE_LABEL.sub("", content)
+
+    # Clean up whitespace
+    # content = re.sub(r'\s+', ' ', content)
+    # Remove leading and trailing whitespace from the content string
+    content = content.strip()
+
+    return content
+
+
+@lru_cache(maxsize=2048)
+def _parse_bib_entry_heuristic(
+    bib_entry: str,
+) -> tuple[Optional[str], tuple[str, ...]]:
+    """Heuristically split a formatted reference string into title and authors.
+
+    These are free-form strings ("Author, \"Title\", Journal, Year"), not
+    BibTeX source, so structural parsers don't apply; memoizing makes repeat
+    entries free instead.
+    """
+    # Try to find quoted title first
+    title_match = _RE_BIB_TITLE.search(bib_entry)
+    if title_match:
+        title = title_match.group(1).strip()
+    else:
+        # Try to find title after author and before journal/venue
+        # This is a heuristic approach
+        parts = _RE_BIB_SPLIT.split(bib_entry)
+        title = None
+        for i, part in enumerate(parts):
+            if len(part.strip()) > 15 and i > 0:  # Likely a title
+                title = part.strip()
+                break
+
+    # Extract authors (usually first part before first comma or period)
+    author_part = (
+        bib_entry.split(",")[0].strip()
+        if "," in bib_entry
+        else bib_entry.split(".")[0].strip()
+    )
+
+    # Split multiple authors
+    if " and " in author_part:
+        authors = [auth.strip() for auth in author_part.split(" and ")]
+    elif "," in author_part and len(author_part.split(",")) <= 3:
+        authors = [auth.strip() for auth in author_part.split(",")]
+    else:
+        authors = [author_part] if author_part else []
+
+    return title, tuple(authors)
+
+
+@lru_cache(maxsize=4096)
+def _title_words(title: str) -> frozenset:
+    """Meaningful words of a title, lowercased.
+
+    Memoized because the same bibliography title is compared against every
+    candidate result of every query strategy during a lookup.
+    """
+    return frozenset(_RE_WORD3.findall(title.lower()))
+
+
+@lru_cache(maxsize=64)
+def _bibtex_field_pattern(field_name: str) -> re.Pattern:
+    """Compiled pattern for one BibTeX field: braced or quoted value."""
+    return re.compile(
+        rf"\b{re.escape(field_name)}\s*=\s*"
+        rf"(?:{{(?P<braced>(?:[^{{}}]|{{(?:[^{{}}]|{{[^{{}}]*}})*}})*)}}"
+        rf'|"(?P<quoted>[^"]*)")',
+        re.IGNORECASE | re.DOTALL,
+    )
+
 
 @dataclass
 class PaperData:
@@ -43,6 +278,7 @@ class PaperData:
     paper_title: str
     abstract: str
     related_works_section: str
+    related_works_length: int = 0
 
 
 @dataclass
@@ -73,6 +309,207 @@ class LatexExtractor:
 
     def __init__(self, config: PipelineConfig):
         self.config = config
+        self._session: aiohttp.ClientSession | None = None
+        # Parsed bibliographies keyed by content hash, so re-parses of the
+        # same .bib content (retries, shared boilerplate) are free
+        self._bib_parse_cache: Dict[bytes, Dict[str, Dict[str, str | None]]] = {}
+        # Per-run memo of search results (including misses) keyed by the
+        # canonical query inputs; cleared in extract_citations_from_papers
+        self._citation_query_cache: Dict[tuple, Optional[Dict[str, str]]] = {}
+        # In-flight background writes of downloaded tarballs to the on-disk
+        # cache; drained in close()
+        self._pending_cache_writes: set = set()
+        # Citation lookups repeat heavily across papers and across re-runs,
+        # so raw arXiv API responses are cached on disk with a TTL
+        os.makedirs(config.output_dir, exist_ok=True)
+        self._query_db = sqlite3.connect(
+            os.path.join(config.output_dir, "arxiv_queries.db"), isolation_level=None
+        )
+        self._query_db.execute("PRAGMA journal_mode=WAL")
+        self._query_db.execute(
+            "CREATE TABLE IF NOT EXISTS queries ("
+            "query TEXT PRIMARY KEY, response TEXT, fetched_at INT)"
+        )
+        # Section patterns depend on the configured section names, so they are
+        # cached per instance rather than at module level.
+        self._related_names_lower = frozenset(
+            " ".join(name.split()).lower()
+            for name in config.related_works_section_names
+        )
+        # Cheap presence probe for a related-works header. Both probes are
+        # built from lowercased names and run against text lowercased once by
+        # the caller: IGNORECASE would pay a per-character casefold instead.
+        self._re_related_header = re.compile(
+            r"\\section\*?\{\s*(?:"
+            + "|".join(
+                re.escape(name.lower()).replace(r"\ ", r"\s+")
+                for name in config.related_works_section_names
+            )
+            + r")\s*\}"
+        )
+        self._re_section_header = re.compile(
+            "|".join(
+                re.escape(f"\\section{{{name.lower()}}}")
+                for name in config.related_works_section_names
+            )
+        )
+        # Candidate section-name occurrences in extracted PDF text; one
+        # compiled scan replaces a per-line, per-name substring loop
+        self._re_pdf_section_name = re.compile(
+            "|".join(
+                re.escape(name.lower())
+                for name in config.related_works_section_names
+            )
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session so connections are pooled."""
+        if self._session is None or self._session.closed:
+            # Reusing connections to arxiv.org avoids paying the TCP+TLS
+            # handshake on every download
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def close(self):
+        """Drain pending cache writes and close the shared HTTP session."""
+        if self._pending_cache_writes:
+            await asyncio.gather(
+                *self._pending_cache_writes, return_exceptions=True
+            )
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._query_db.close()
+
+    async def _arxiv_api_query(self, params: Dict[str, str]) -> str:
+        """Fetch an arXiv API response, serving repeats from the on-disk cache.
+
+        Entries are keyed by the normalized query parameters and expire after
+        ``ARXIV_QUERY_CACHE_TTL_SECONDS`` so refreshed metadata is eventually
+        picked up.
+        """
+        cache_key = "|".join(f"{key}={params[key]}" for key in sorted(params))
+        row = self._query_db.execute(
+            "SELECT response, fetched_at FROM queries WHERE query = ?", (cache_key,)
+        ).fetchone()
+        if (
+            row is not None
+            and row[1] >= int(time.time()) - ARXIV_QUERY_CACHE_TTL_SECONDS
+        ):
+            return row[0]
+
+        session = await self._get_session()
+        async with session.get(
+            "http://export.arxiv.org/api/query",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            response.raise_for_status()
+            body = await response.text()
+
+        self._query_db.execute(
+            "INSERT OR REPLACE INTO queries VALUES (?, ?, ?)",
+            (cache_key, body, int(time.time())),
+        )
+        return body
+
+    @staticmethod
+    def _arxiv_id_from_bib_entry(
+        bib_entry: Dict[str, str | None],
+    ) -> Optional[str]:
+        """Pull an arXiv ID out of a bibliography entry's url or doi field."""
+        url = bib_entry.get("url")
+        if url:
+            match = _RE_ARXIV_ID_URL.search(url)
+            if match:
+                return _RE_ARXIV_ID_VERSION.sub("", match.group(1))
+        doi = bib_entry.get("doi")
+        if doi:
+            match = _RE_ARXIV_ID_DOI.search(doi)
+            if match:
+                return match.group(1)
+        return None
+
+    async def _resolve_dois_batch(self, dois: List[str]) -> Dict[str, Dict[str, str]]:
+        """Resolve DOIs to paper metadata via Semantic Scholar's batch endpoint.
+
+        One POST covers up to 500 DOIs, replacing a slow, low-precision arXiv
+        title search per DOI-bearing bibliography entry. Results are keyed by
+        lowercased DOI.
+        """
+        results: Dict[str, Dict[str, str]] = {}
+        url = "https://api.semanticscholar.org/graph/v1/paper/batch"
+        params = {"fields": "title,abstract,externalIds"}
+        session = await self._get_session()
+
+        for start in range(0, len(dois), 500):
+            batch = dois[start : start + 500]
+            try:
+                async with session.post(
+                    url,
+                    params=params,
+                    json={"ids": [f"DOI:{doi}" for doi in batch]},
+                ) as response:
+                    response.raise_for_status()
+                    payload = await response.json()
+            except Exception as e:
+                logger.debug(f"Semantic Scholar DOI batch lookup failed: {e}")
+                continue
+
+            for doi, paper_data in zip(batch, payload):
+                if not paper_data:
+                    continue
+                external_ids = paper_data.get("externalIds") or {}
+                arxiv_id = external_ids.get("ArXiv")
+                results[doi.lower()] = {
+                    "title": paper_data.get("title") or "",
+                    "abstract": paper_data.get("abstract") or "",
+                    "abs_url": (
+                        f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else ""
+                    ),
+                }
+
+        return results
+
+    async def _fetch_arxiv_entries_by_ids(
+        self, arxiv_ids: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        """Resolve arXiv IDs to paper metadata via the batched id_list endpoint.
+
+        One request covers up to 50 IDs, replacing a per-citation search for
+        every bibliography entry that already names its arXiv ID.
+        """
+        results: Dict[str, Dict[str, str]] = {}
+
+        for start in range(0, len(arxiv_ids), 50):
+            chunk = arxiv_ids[start : start + 50]
+            params = {
+                "id_list": ",".join(chunk),
+                "start": "0",
+                "max_results": str(len(chunk)),
+            }
+            try:
+                body = await self._arxiv_api_query(params)
+                for entry in _iter_atom_entries(body):
+                    parsed = _parse_atom_entry(entry)
+                    if not parsed["id"]:
+                        continue
+                    arxiv_id = _RE_ARXIV_ID_VERSION.sub(
+                        "", parsed["id"].rsplit("/", 1)[-1]
+                    )
+                    results[arxiv_id] = {
+                        "title": parsed["title"],
+                        "abstract": parsed["abstract"],
+                        "abs_url": parsed["abs_url"] or parsed["id"],
+                    }
+            except Exception as e:
+                logger.debug(f"Batched arXiv ID lookup failed: {e}")
+                continue
+
+        return results
 
     async def extract_papers_content(self, papers: List[ArxivPaper]) -> List[PaperData]:
         """
@@ -90,104 +527,112 @@ class LatexExtractor:
             )
             return []
 
-        paper_data_list = []
-
-        for paper in papers:
-            try:
-                logger.info(f"Processing paper: {paper.title}")
-
-                # Download LaTeX source first (for citation extraction)
-                latex_content = await self._download_latex_source(paper)
-                if not latex_content:
-                    logger.warning(
-                        f"Could not download LaTeX source for {paper.arxiv_id}"
-                    )
-                    continue
+        # Fan out over papers; the semaphore bounds concurrent downloads so we
+        # stay polite to arxiv.org while overlapping network latency
+        semaphore = asyncio.Semaphore(self.config.concurrent_requests)
 
-                # Store project files temporarily for multi-file support
-                if hasattr(paper, "_project_files"):
-                    self._current_project_files = paper._project_files
-                else:
-                    self._current_project_files = None
+        async def process_one(paper: ArxivPaper) -> Optional[PaperData]:
+            async with semaphore:
+                paper_data = await self._extract_paper_content(paper)
+                # Add delay to be respectful
+                await asyncio.sleep(self.config.request_delay)
+                return paper_data
 
-                # Extract related works section from LaTeX (for citation parsing)
-                latex_related_works = self._extract_related_works_section(latex_content)
-                if not latex_related_works:
-                    logger.warning(
-                        f"No related works section found in LaTeX for {paper.arxiv_id}"
-                    )
-                    continue
+        results = await asyncio.gather(
+            *(process_one(paper) for paper in papers), return_exceptions=True
+        )
 
-                # Download PDF and extract related works section from it (for clean final output)
-                pdf_related_works = await self._download_and_extract_pdf_related_works(
-                    paper
-                )
-                clean_latex_content = self._clean_latex_content(latex_related_works)
-                pdf_failed = False
-                if not pdf_related_works:
-                    logger.warning(
-                        f"No related works section found in PDF for {paper.arxiv_id}, using LaTeX version"
-                    )
-                    pdf_related_works = clean_latex_content
-                    pdf_failed = True
-                # Create PaperData object with PDF-extracted related works for final output
-                paper_data = PaperData(
-                    arxiv_link=paper.abs_url,
-                    publication_date=paper.published_date,
-                    paper_title=paper.title,
-                    abstract=paper.abstract,
-                    related_works_section=pdf_related_works,  # Clean version for CSV output
-                )
+        paper_data_list = []
+        for paper, result in zip(papers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error processing paper {paper.arxiv_id}: {result}")
+            elif result is not None:
+                paper_data_list.append(result)
 
-                # Store LaTeX-based related works for citation extraction
-                paper_data._latex_related_works = (  # type: ignore
-                    latex_related_works  # Raw LaTeX for citation parsing
-                )
-                paper_data._full_latex_content = latex_content  # type: ignore
-                paper_data._paper_object = (  # type: ignore
-                    paper  # Store reference to access project files
-                )
+        logger.info(
+            f"Successfully extracted content from {len(paper_data_list)} papers"
+        )
+        return paper_data_list
 
-                paper_data_list.append(paper_data)
-
-                # Save paper data to temporary CSV file for debugging
-                temp_dir = os.path.join(self.config.output_dir, "related_works")
-                os.makedirs(temp_dir, exist_ok=True)
-                temp_file = os.path.join(temp_dir, f"{paper.arxiv_id}.csv")
-
-                # Create DataFrame with paper data
-                temp_data = {
-                    "arxiv_id": [paper.arxiv_id],
-                    "arxiv_link": [paper.abs_url],
-                    "publication_date": [paper.published_date],
-                    "title": [paper.title],
-                    "abstract": [paper.abstract],
-                    "raw_latex_related_works": [latex_related_works],
-                    "clean_latex_related_works": [clean_latex_content],
-                    "pdf_related_works": [pdf_related_works]
-                    if not pdf_failed
-                    else "N/A",
-                }
-                temp_df = pd.DataFrame(temp_data)
+    async def _extract_paper_content(self, paper: ArxivPaper) -> Optional[PaperData]:
+        """Extract the related works section of a single paper."""
+        logger.info(f"Processing paper: {paper.title}")
 
-                # Save to CSV
-                temp_df.to_csv(temp_file, index=False)
-                logger.info(f"Saved temporary paper data to {temp_file}")
+        # Download LaTeX source first (for citation extraction)
+        latex_content = await self._download_latex_source(paper)
+        if not latex_content:
+            logger.warning(f"Could not download LaTeX source for {paper.arxiv_id}")
+            return None
 
-                # Clean up temporary storage
-                self._current_project_files = None
+        # Store project files temporarily for multi-file support
+        if hasattr(paper, "_project_files"):
+            self._current_project_files = paper._project_files
+        else:
+            self._current_project_files = None
 
-                # Add delay to be respectful
-                await asyncio.sleep(self.config.request_delay)
+        # Extract related works section from LaTeX (for citation parsing)
+        latex_related_works = self._extract_related_works_section(latex_content)
+        if not latex_related_works:
+            logger.warning(
+                f"No related works section found in LaTeX for {paper.arxiv_id}"
+            )
+            return None
 
-            except Exception as e:
-                logger.error(f"Error processing paper {paper.arxiv_id}: {e}")
-                continue
+        # Download PDF and extract related works section from it (for clean final output)
+        pdf_related_works = await self._download_and_extract_pdf_related_works(paper)
+        clean_latex_content = self._clean_latex_content(latex_related_works)
+        pdf_failed = False
+        if not pdf_related_works:
+            logger.warning(
+                f"No related works section found in PDF for {paper.arxiv_id}, using LaTeX version"
+            )
+            pdf_related_works = clean_latex_content
+            pdf_failed = True
+        # Create PaperData object with PDF-extracted related works for final output
+        paper_data = PaperData(
+            arxiv_link=paper.abs_url,
+            publication_date=paper.published_date,
+            paper_title=paper.title,
+            abstract=paper.abstract,
+            related_works_section=pdf_related_works,  # Clean version for CSV output
+            related_works_length=len(pdf_related_works) if pdf_related_works else 0,
+        )
 
-        logger.info(
-            f"Successfully extracted content from {len(paper_data_list)} papers"
+        # Store LaTeX-based related works for citation extraction
+        paper_data._latex_related_works = (  # type: ignore
+            latex_related_works  # Raw LaTeX for citation parsing
+        )
+        paper_data._full_latex_content = latex_content  # type: ignore
+        paper_data._paper_object = (  # type: ignore
+            paper  # Store reference to access project files
         )
-        return paper_data_list
+
+        # Save paper data to temporary CSV file for debugging; plain
+        # csv.DictWriter skips pandas' per-frame construction overhead
+        temp_dir = os.path.join(self.config.output_dir, "related_works")
+        os.makedirs(temp_dir, exist_ok=True)
+        temp_file = os.path.join(temp_dir, f"{paper.arxiv_id}.csv")
+
+        temp_row = {
+            "arxiv_id": paper.arxiv_id,
+            "arxiv_link": paper.abs_url,
+            "publication_date": paper.published_date,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "raw_latex_related_works": latex_related_works,
+            "clean_latex_related_works": clean_latex_content,
+            "pdf_related_works": pdf_related_works if not pdf_failed else "N/A",
+        }
+        with open(temp_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(temp_row))
+            writer.writeheader()
+            writer.writerow(temp_row)
+        logger.info(f"Saved temporary paper data to {temp_file}")
+
+        # Clean up temporary storage
+        self._current_project_files = None
+
+        return paper_data
 
     async def extract_citations_from_papers(
         self, paper_data_list: List[PaperData]
@@ -201,68 +646,133 @@ class LatexExtractor:
         Returns:
             List of CitationData objects
         """
-        all_citations = []
-
-        for paper_data in paper_data_list:
-            try:
-                logger.info(f"Extracting citations from: {paper_data.paper_title}")
-
-                # First get the full LaTeX content to extract bibliography
-                latex_content = getattr(paper_data, "_full_latex_content", None)
-                bibliography = None
-
-                if latex_content:
-                    # Get project files for bibliography lookup
-                    project_files = getattr(paper_data, "_paper_object", None)
-                    if hasattr(paper_data, "_paper_object") and hasattr(
-                        paper_data._paper_object, "_project_files"
-                    ):
-                        project_files = paper_data._paper_object._project_files
-                    else:
-                        project_files = None
-
-                    bibliography = self._extract_bibliography(
-                        latex_content, project_files
-                    )
-                    if bibliography:
-                        logger.info(
-                            f"Found bibliography with {len(bibliography)} entries"
-                        )
+        # Fresh per-run memo for the search methods; citations from the same
+        # group collide on their queries, so hits skip the HTTP entirely
+        self._citation_query_cache.clear()
 
-                # Parse citations from related works section
-                citations = await self._extract_citations_from_text(
-                    getattr(
-                        paper_data,
-                        "_latex_related_works",
-                        paper_data.related_works_section,
-                    ),  # Use LaTeX version for citation parsing
-                    paper_data.paper_title,
-                    paper_data.arxiv_link,
-                    bibliography,
-                )
-                # save temporary citations for paper
-                temp_df = pd.DataFrame(citations)
-                temp_dir = os.path.join(self.config.output_dir, "citations")
-                os.makedirs(temp_dir, exist_ok=True)
-                arxiv_id = paper_data.arxiv_link.split("/")[-1]
-                temp_file = os.path.join(temp_dir, f"{arxiv_id}.csv")
-                temp_df.to_csv(temp_file, index=False)
-                logger.info(f"Saved temporary citations to {temp_file}")
-
-                all_citations.extend(citations)
+        semaphore = asyncio.Semaphore(self.config.concurrent_requests)
 
+        async def process_one(paper_data: PaperData) -> List[CitationData]:
+            async with semaphore:
+                citations = await self._extract_paper_citations(paper_data)
                 # Add delay between citation lookups
                 await asyncio.sleep(self.config.request_delay)
+                return citations
 
-            except Exception as e:
+        results = await asyncio.gather(
+            *(process_one(paper_data) for paper_data in paper_data_list),
+            return_exceptions=True,
+        )
+
+        all_citations = []
+        for paper_data, result in zip(paper_data_list, results):
+            if isinstance(result, BaseException):
                 logger.error(
-                    f"Error extracting citations from {paper_data.paper_title}: {e}"
+                    f"Error extracting citations from {paper_data.paper_title}: {result}"
                 )
-                continue
+            else:
+                all_citations.extend(result)
 
         logger.info(f"Extracted {len(all_citations)} citations total")
         return all_citations
 
+    async def _extract_paper_citations(
+        self, paper_data: PaperData
+    ) -> List[CitationData]:
+        """Extract and look up the citations of a single paper."""
+        logger.info(f"Extracting citations from: {paper_data.paper_title}")
+
+        # First get the full LaTeX content to extract bibliography
+        latex_content = getattr(paper_data, "_full_latex_content", None)
+        bibliography = None
+
+        if latex_content:
+            # Get project files for bibliography lookup
+            project_files = getattr(paper_data, "_paper_object", None)
+            if hasattr(paper_data, "_paper_object") and hasattr(
+                paper_data._paper_object, "_project_files"
+            ):
+                project_files = paper_data._paper_object._project_files
+            else:
+                project_files = None
+
+            bibliography = self._extract_bibliography(latex_content, project_files)
+            if bibliography:
+                logger.info(f"Found bibliography with {len(bibliography)} entries")
+
+        # Bibliography entries that already name an arXiv ID can be resolved
+        # in one batched id_list request instead of per-citation searches
+        arxiv_prefetch = None
+        if bibliography:
+            ids_by_key = {
+                key.lower(): arxiv_id
+                for key, entry in bibliography.items()
+                if (arxiv_id := self._arxiv_id_from_bib_entry(entry))
+            }
+            if ids_by_key:
+                fetched = await self._fetch_arxiv_entries_by_ids(
+                    sorted(set(ids_by_key.values()))
+                )
+                arxiv_prefetch = {
+                    key: fetched[arxiv_id]
+                    for key, arxiv_id in ids_by_key.items()
+                    if arxiv_id in fetched
+                }
+                logger.info(
+                    f"Prefetched {len(arxiv_prefetch)} arXiv entries by ID "
+                    f"({len(ids_by_key)} bibliography entries carry IDs)"
+                )
+
+            # Entries with a DOI but no embedded arXiv ID resolve through
+            # Semantic Scholar's paper/batch endpoint in one round-trip
+            dois_by_key = {
+                key.lower(): doi
+                for key, entry in bibliography.items()
+                if (doi := entry.get("doi")) and key.lower() not in ids_by_key
+            }
+            if dois_by_key:
+                resolved = await self._resolve_dois_batch(
+                    sorted({doi.lower() for doi in dois_by_key.values()})
+                )
+                doi_prefetch = {
+                    key: resolved[doi.lower()]
+                    for key, doi in dois_by_key.items()
+                    if doi.lower() in resolved
+                }
+                if doi_prefetch:
+                    logger.info(
+                        f"Resolved {len(doi_prefetch)} bibliography DOIs via "
+                        "Semantic Scholar batch lookup"
+                    )
+                    arxiv_prefetch = {**doi_prefetch, **(arxiv_prefetch or {})}
+
+        # Parse citations from related works section
+        citations = await self._extract_citations_from_text(
+            getattr(
+                paper_data,
+                "_latex_related_works",
+                paper_data.related_works_section,
+            ),  # Use LaTeX version for citation parsing
+            paper_data.paper_title,
+            paper_data.arxiv_link,
+            bibliography,
+            arxiv_prefetch,
+        )
+        # save temporary citations for paper
+        temp_dir = os.path.join(self.config.output_dir, "citations")
+        os.makedirs(temp_dir, exist_ok=True)
+        arxiv_id = paper_data.arxiv_link.split("/")[-1]
+        temp_file = os.path.join(temp_dir, f"{arxiv_id}.csv")
+        with open(temp_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=[field.name for field in fields(CitationData)]
+            )
+            writer.writeheader()
+            writer.writerows(asdict(citation) for citation in citations)
+        logger.info(f"Saved temporary citations to {temp_file}")
+
+        return citations
+
     async def _download_latex_source(self, paper: ArxivPaper) -> Optional[str]:
         """Download and extract LaTeX source from ArXiv."""
         try:
@@ -273,42 +783,83 @@ class LatexExtractor:
             temp_dir = os.path.join(self.config.output_dir, "latex_source")
             os.makedirs(temp_dir, exist_ok=True)
             archive_path = os.path.join(temp_dir, f"{arxiv_id}.tar.gz")
-            temp_dir = temp_dir + "/" + arxiv_id
-            latex_content: str | None
+            meta_path = archive_path + ".meta.json"
+
+            content = None
+            cached_content = None
+            conditional_headers = {}
             if os.path.exists(archive_path):
-                logger.info(
-                    f"Using cached LaTeX source for {arxiv_id} from {archive_path}"
-                )
                 with open(archive_path, "rb") as f:
-                    content = f.read()
-            else:
-                # Download the source archive
-                response = requests.get(source_url, timeout=30)
-                response.raise_for_status()
-                content = response.content
+                    cached_content = f.read()
+                conditional_headers = self._load_conditional_headers(meta_path)
+                if not conditional_headers:
+                    # Legacy cache without validators: reuse without a round-trip
+                    logger.info(
+                        f"Using cached LaTeX source for {arxiv_id} from {archive_path}"
+                    )
+                    content = cached_content
 
-                with open(archive_path, "wb") as f:
-                    f.write(content)
+            if content is None:
+                # Download (or revalidate) the source archive; a 304 costs no
+                # body bytes and keep-alive amortizes the round-trip
+                session = await self._get_session()
+                try:
+                    async with session.get(
+                        source_url, headers=conditional_headers
+                    ) as response:
+                        if response.status == 304 and cached_content is not None:
+                            logger.info(
+                                f"Cached LaTeX source for {arxiv_id} is still fresh (304)"
+                            )
+                            content = cached_content
+                        else:
+                            response.raise_for_status()
+                            content = await response.read()
+                            meta = {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            }
 
-            # Extract the archive
+                            # Cache the tarball bytes in the background;
+                            # parsing below works from memory and never waits
+                            # on the disk write
+                            task = asyncio.create_task(
+                                asyncio.to_thread(
+                                    self._write_archive_cache,
+                                    archive_path,
+                                    content,
+                                    meta,
+                                )
+                            )
+                            self._pending_cache_writes.add(task)
+                            task.add_done_callback(self._pending_cache_writes.discard)
+                except aiohttp.ClientError as e:
+                    if cached_content is None:
+                        raise
+                    logger.warning(
+                        f"Revalidation failed for {arxiv_id}, using cached archive: {e}"
+                    )
+                    content = cached_content
+
+            # Parse the archive straight from memory; only the tarball bytes
+            # are cached on disk, never the expanded tree
             try:
-                with tarfile.open(archive_path, "r:gz") as tar:
-                    tar.extractall(temp_dir)
+                with tarfile.open(fileobj=io.BytesIO(content), mode="r:gz") as tar:
+                    project_files = self._read_project_files_from_tar(tar)
             except tarfile.ReadError as e:
                 # Try as a regular file (sometimes ArXiv returns single .tex files)
-                latex_content = content.decode("utf-8", errors="ignore")
                 logger.warning(
                     f"Failed to extract tar.gz archive for {paper.arxiv_id}, treating as single .tex file"
                 )
                 logger.error(f"Error reading tar.gz: {e}")
-                return latex_content
+                return content.decode("utf-8", errors="ignore")
 
             # Find the main .tex file
-            latex_content = self._find_main_tex_file(temp_dir)
+            latex_content = self._find_main_tex_file(project_files)
 
-            # Read all project files for bibliography lookup (before temp_dir is deleted)
+            # Keep all project files for bibliography lookup
             if latex_content:
-                paper._project_files = self._read_all_project_files(temp_dir)
+                paper._project_files = project_files
 
             return latex_content
 
@@ -316,115 +867,109 @@ class LatexExtractor:
             logger.error(f"Error downloading LaTeX source for {paper.arxiv_id}: {e}")
             return None
 
-    def _read_all_project_files(self, directory: str) -> Dict[str, str]:
-        """Read all text files in the project directory for bibliography lookup."""
+    @staticmethod
+    def _load_conditional_headers(meta_path: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from cached metadata."""
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @staticmethod
+    def _write_archive_cache(
+        archive_path: str, content: bytes, meta: Dict[str, Optional[str]]
+    ) -> None:
+        """Write downloaded tarball bytes and their HTTP validators to disk."""
+        try:
+            # Serialize before opening so an unserializable value cannot
+            # leave a truncated sidecar behind
+            meta_json = json.dumps(meta)
+            with open(archive_path, "wb") as f:
+                f.write(content)
+            with open(archive_path + ".meta.json", "w", encoding="utf-8") as f:
+                f.write(meta_json)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache LaTeX source to {archive_path}: {e}")
+
+    def _read_project_files_from_tar(self, tar: tarfile.TarFile) -> Dict[str, str]:
+        """Read all relevant project files from a tar archive into memory."""
         project_files = {}
 
-        # Read .tex files
-        for tex_file in Path(directory).glob("**/*.tex"):
-            try:
-                content = tex_file.read_text(encoding="utf-8", errors="ignore")
-                project_files[tex_file.name] = content
-            except Exception as e:
-                logger.debug(f"Could not read {tex_file}: {e}")
-
-        # Read .bib files
-        for bib_file in Path(directory).glob("**/*.bib"):
+        for member in tar:
+            if not member.isfile():
+                continue
+            if not member.name.lower().endswith(_PROJECT_FILE_EXTENSIONS):
+                continue
             try:
-                content = bib_file.read_text(encoding="utf-8", errors="ignore")
-                project_files[bib_file.name] = content
+                fileobj = tar.extractfile(member)
+                if fileobj is None:
+                    continue
+                content = fileobj.read().decode("utf-8", errors="ignore")
+                project_files[os.path.basename(member.name)] = content
             except Exception as e:
-                logger.debug(f"Could not read {bib_file}: {e}")
-
-        # Read .bbx, .bst, and other bibliography-related files
-        for ext in ["*.bbx", "*.bst", "*.cls", "*.sty", "*.bbl"]:
-            for file_path in Path(directory).glob(f"**/{ext}"):
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    project_files[file_path.name] = content
-                except Exception as e:
-                    logger.debug(f"Could not read {file_path}: {e}")
+                logger.debug(f"Could not read {member.name}: {e}")
 
         logger.debug(
             f"Read {len(project_files)} project files: {list(project_files.keys())}"
         )
         return project_files
 
-    def _find_main_tex_file(self, directory: str) -> Optional[str]:
-        """Find and read the main LaTeX file from extracted archive."""
-        tex_files = list(Path(directory).glob("**/*.tex"))
-
-        if not tex_files:
-            return None
-
-        # Heuristics to find the main file
-        main_candidates = []
+    def _find_main_tex_file(self, project_files: Dict[str, str]) -> Optional[str]:
+        """Find the content of the main LaTeX file among the project files."""
+        # Heuristics to find the main file: scan once, keeping only the
+        # longest candidate seen so far
+        best_content = None
 
-        for tex_file in tex_files:
-            # import pdb; pdb.set_trace()
-            content = tex_file.read_text(encoding="utf-8", errors="ignore")
+        for name, content in project_files.items():
+            if not name.endswith(".tex"):
+                continue
 
             # Look for document class (main files typically have this)
             # if r'\documentclass' in content:
-            match_names = [
-                f"\\section{{{name}}}"
-                for name in self.config.related_works_section_names
-            ]
-            match_names = [re.escape(name) for name in match_names]
-            if any(
-                re.search(pattern, content, re.IGNORECASE) for pattern in match_names
-            ):
+            if self._re_section_header.search(content.lower()):
                 # if r'\section{Related work}' in content:
-                main_candidates.append((tex_file, content))
-
-            # match_names = [f"\\subsection{{{name}}}" for name in self.config.related_works_section_names]
-            # match_names = [re.escape(name) for name in match_names]
-            # if any(re.search(pattern, content, re.IGNORECASE) for pattern in match_names):
-            # # if r'\section{Related work}' in content:
-            #     main_candidates.append((tex_file, content))
-
-        if main_candidates:
-            # If multiple candidates, prefer the one with more content
-            main_file, content = max(main_candidates, key=lambda x: len(x[1]))
-            return content
-
-        # # Fallback: return the largest .tex file
-        # if tex_files:
-        #     largest_file = max(tex_files, key=lambda f: f.stat().st_size)
-        #     return largest_file.read_text(encoding='utf-8', errors='ignore')
+                # If multiple candidates, prefer the one with more content
+                if best_content is None or len(content) > len(best_content):
+                    best_content = content
 
-        return None
+        return best_content
 
     def _extract_related_works_section(self, latex_content: str) -> Optional[str]:
         """Extract related works section from LaTeX content, supporting both inline and multi-file projects."""
 
-        # First, try the current logic - look for sections directly in the main file
-        section_patterns = []
-        for section_name in self.config.related_works_section_names:
-            # Escape special regex characters and create flexible pattern
-            escaped_name = re.escape(section_name)
-            # Allow for some flexibility in spacing and formatting
-            pattern = escaped_name.replace(r"\ ", r"\s+")
-            section_patterns.append(pattern)
-
-        # Create comprehensive regex pattern for inline sections
-        pattern = (
-            r"\\section\*?\{("
-            + "|".join(section_patterns)
-            + r")\}(.*?)(?=\\section|\Z)"
-        )
-
-        matches = re.findall(pattern, latex_content, re.DOTALL | re.IGNORECASE)
-
-        if matches:
-            # Return the RAW content of the first matching section (don't clean yet!)
-            section_title, section_content = matches[0]
+        # First, try the current logic - look for sections directly in the
+        # main file. Plain substring containment rejects papers that never
+        # mention a section name without touching the regex engine; the
+        # header probe then guards the split.
+        latex_lower = latex_content.lower()
+        if any(
+            name in latex_lower for name in self._related_names_lower
+        ) and self._re_related_header.search(latex_lower):
+            # Split once on section headers, then match titles with a hash
+            # lookup (whitespace-normalized, case-insensitive)
+            parts = _RE_SECTION_SPLIT.split(latex_content)
+            for section_title, section_content in zip(parts[1::2], parts[2::2]):
+                if (
+                    " ".join(section_title.split()).lower()
+                    not in self._related_names_lower
+                ):
+                    continue
 
-            if len(section_content.strip()) >= 100:  # Minimum length check
-                logger.info(
-                    f"Found related works section directly in main file: '{section_title}'"
-                )
-                return section_content.strip()
+                # Return the RAW content of the first matching section (don't clean yet!)
+                if len(section_content.strip()) >= 100:  # Minimum length check
+                    logger.info(
+                        f"Found related works section directly in main file: '{section_title}'"
+                    )
+                    return section_content.strip()
+                break
 
         # If no direct section found, look for multi-file structure
         logger.info(
@@ -432,8 +977,7 @@ class LatexExtractor:
         )
 
         # Look for \input{} commands that might include related works
-        input_pattern = r"\\input\{([^}]+)\}"
-        input_matches = re.findall(input_pattern, latex_content, re.IGNORECASE)
+        input_matches = _RE_INPUT.findall(latex_content)
 
         if input_matches:
             logger.info(f"Found \\input commands: {input_matches}")
@@ -488,23 +1032,7 @@ class LatexExtractor:
         # Remove path and extension for checking
         base_name = filename.split("/")[-1].replace(".tex", "").lower()
 
-        related_keywords = [
-            "relatedwork",
-            "related_work",
-            "related-work",
-            "background",
-            "literature",
-            "survey",
-            "prior",
-            "previous",
-            "review",
-        ]
-
-        for keyword in related_keywords:
-            if keyword in base_name:
-                return True
-
-        return False
+        return bool(_RE_RELATED_KEYWORD.search(base_name))
 
     def _search_all_files_for_related_works(self) -> Optional[str]:
         """Search all project files for related works content."""
@@ -525,29 +1053,21 @@ class LatexExtractor:
             if "documentclass" in content:
                 continue
 
-            # Look for section headers in this file
-            section_pattern = r"\\section\*?\{([^}]+)\}"
-            sections = re.findall(section_pattern, content, re.IGNORECASE)
-
-            for section_title in sections:
-                # Check if this section title matches our related works patterns
-                for target_name in self.config.related_works_section_names:
-                    if target_name.lower() in section_title.lower():
-                        # Extract the content of this section
-                        section_content_pattern = (
-                            r"\\section\*?\{"
-                            + re.escape(section_title)
-                            + r"\}(.*?)(?=\\section|\Z)"
-                        )
-                        section_matches = re.findall(
-                            section_content_pattern, content, re.DOTALL | re.IGNORECASE
+            # Split once on section headers; bodies come for free, so no
+            # per-title content regex is needed
+            parts = _RE_SECTION_SPLIT.split(content)
+
+            for section_title, section_content in zip(parts[1::2], parts[2::2]):
+                # Check if this section title matches our related works
+                # patterns; lowercase once and compare against the
+                # precomputed lowercase names
+                title_lower = section_title.lower()
+                if any(name in title_lower for name in self._related_names_lower):
+                    if len(section_content.strip()) >= 100:
+                        logger.info(
+                            f"Found related works section '{section_title}' in file '{filename}'"
                         )
-
-                        if section_matches and len(section_matches[0].strip()) >= 100:
-                            logger.info(
-                                f"Found related works section '{section_title}' in file '{filename}'"
-                            )
-                            return section_matches[0].strip()
+                        return section_content.strip()
 
             # If no section headers, but filename suggests related works, use entire content
             if (
@@ -577,84 +1097,114 @@ class LatexExtractor:
 
     def _clean_latex_content(self, content: str) -> str:
         """Clean LaTeX content by removing common commands and formatting."""
-        # Remove comments
-        content = re.sub(r"%.*$", "", content, flags=re.MULTILINE)
-
-        # Remove figures and their content
-        content = re.sub(
-            r"\\begin\{figure\}.*?\\end\{figure\}", "", content, flags=re.DOTALL
-        )
-        content = re.sub(
-            r"\\begin\{figure\*\}.*?\\end\{figure\*\}", "", content, flags=re.DOTALL
-        )
-        content = re.sub(
-            r"\\begin\{subfigure\}.*?\\end\{subfigure\}", "", content, flags=re.DOTALL
-        )
-        content = re.sub(
-            r"\\begin\{subfigure\*\}.*?\\end\{subfigure\*\}",
-            "",
-            content,
-            flags=re.DOTALL,
-        )
-
-        # Remove common LaTeX commands but keep the text, preserving citation commands
-        # content = re.sub(r'\\[a-zA-Z]+\*?\{([^}]*)\}(?!\s*\\cite\{|\s*\\citep\{)', r'\1', content)  # Don't remove \cite{} or \citep{}
-        # content = re.sub(r'\\[a-zA-Z]+\*?\[[^\]]*\]\{([^}]*)\}(?!\s*\\cite\{|\s*\\citep\{)', r'\1', content)  # Don't remove \cite{} or \citep{}
-        # content = re.sub(r'(?!\\cite|\\citep)\\\([a-zA-Z]+\*?\{([^}]*)\}', r'\1', content)
-        # content = re.sub(r'(?!\\cite|\\citep)\\\([a-zA-Z]+\*?\[[^\]]*\]\{([^}]*)\}', r'\1', content)
-
-        # # Remove standalone commands
-        # content = re.sub(r'\\[a-zA-Z]+\*?', '', content)
-
-        # Remove labels and possible newline
-        content = re.sub(r"\\label\{[^}]*\}\n?", "", content)
-
-        # Clean up whitespace
-        # content = re.sub(r'\s+', ' ', content)
-        # Remove leading and trailing whitespace from the content string
-        content = content.strip()
-
-        return content
+        return _clean_latex_content_cached(content)
 
     def _parse_bib_file(self, bib_content: str) -> Dict[str, Dict[str, str | None]]:
         """Parse a .bbl file and extract entries."""
+        cache_key = hashlib.blake2b(
+            bib_content.encode("utf-8", errors="ignore"), digest_size=16
+        ).digest()
+        cached = self._bib_parse_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         bibliography = {}
 
         # Pattern to match BibTeX entries
         # @article{key, field1={value1}, field2={value2}, ...}
-        bibtex_pattern = r"@\w+\s*\{\s*([^,\s]+)\s*,(.*?)(?=@\w+\s*\{|\Z)"
-
-        entries = re.findall(bibtex_pattern, bib_content, re.DOTALL | re.IGNORECASE)
+        entries = _RE_BIBTEX_ENTRY.findall(bib_content)
 
         for key, fields in entries:
             # Clean the key
             clean_key = key.strip()
-            # Extract all available fields from BibTeX entry
-            title = self._extract_bibtex_field(fields, "title")
-            author = self._extract_bibtex_field(fields, "author")
-            year = self._extract_bibtex_field(fields, "year")
-            month = self._extract_bibtex_field(fields, "month")
-            journal = self._extract_bibtex_field(fields, "journal")
-            url = self._extract_bibtex_field(fields, "url")
-            url_2 = self._extract_bibtex_field(fields, "URL")
-            doi = self._extract_bibtex_field(fields, "doi")
+            # Lex all fields of the entry in one pass instead of running a
+            # targeted regex per field
+            raw_fields = self._tokenize_bibtex_fields(fields)
 
             # Create a formatted bibliography entry
             bib_entry = dict()
-            bib_entry["author"] = author if author else None
-            bib_entry["title"] = title if title else None
-            bib_entry["journal"] = journal if journal else None
-            bib_entry["year"] = year if year else None
-            bib_entry["month"] = month if month else None
-            bib_entry["doi"] = doi if doi else None
-            bib_entry["url"] = url_2 if url_2 else url if url else None
+            bib_entry["author"] = self._clean_bib_value(raw_fields.get("author"))
+            bib_entry["title"] = self._clean_bib_value(raw_fields.get("title"))
+            bib_entry["journal"] = self._clean_bib_value(raw_fields.get("journal"))
+            bib_entry["year"] = self._clean_bib_value(raw_fields.get("year"))
+            bib_entry["month"] = self._clean_bib_value(raw_fields.get("month"))
+            bib_entry["doi"] = self._clean_bib_value(raw_fields.get("doi"))
+            bib_entry["url"] = self._clean_bib_value(raw_fields.get("url"))
 
             if bib_entry:
                 bibliography[clean_key] = bib_entry
                 logger.debug(f"BibTeX entry: {clean_key} -> {bibliography[clean_key]}")
 
+        self._bib_parse_cache[cache_key] = bibliography
         return bibliography
 
+    @staticmethod
+    def _tokenize_bibtex_fields(fields: str) -> Dict[str, str]:
+        """Lex `name = {value}` / `name = "value"` pairs in a single pass.
+
+        Brace-balanced values are consumed with a depth counter, which regex
+        can only approximate with nested groups. Field names are lowercased;
+        the first occurrence of a field wins.
+        """
+        values: Dict[str, str] = {}
+        i = 0
+        n = len(fields)
+
+        while i < n:
+            # Skip separators until a field name can start
+            while i < n and not (fields[i].isalpha() or fields[i] == "_"):
+                i += 1
+            start = i
+            while i < n and (fields[i].isalnum() or fields[i] in "_-"):
+                i += 1
+            name = fields[start:i].lower()
+
+            while i < n and fields[i].isspace():
+                i += 1
+            if not name or i >= n or fields[i] != "=":
+                continue
+            i += 1
+            while i < n and fields[i].isspace():
+                i += 1
+            if i >= n:
+                break
+
+            if fields[i] == "{":
+                depth = 1
+                i += 1
+                start = i
+                while i < n and depth:
+                    if fields[i] == "{":
+                        depth += 1
+                    elif fields[i] == "}":
+                        depth -= 1
+                    i += 1
+                value = fields[start : i - 1] if depth == 0 else fields[start:i]
+            elif fields[i] == '"':
+                i += 1
+                start = i
+                while i < n and fields[i] != '"':
+                    i += 1
+                value = fields[start:i]
+                i += 1
+            else:
+                # Bare value (numbers, macros like month abbreviations)
+                start = i
+                while i < n and fields[i] not in ",\n":
+                    i += 1
+                value = fields[start:i]
+
+            values.setdefault(name, value)
+
+        return values
+
+    def _clean_bib_value(self, value: Optional[str]) -> Optional[str]:
+        """Normalize a raw BibTeX field value, mapping empty results to None."""
+        if not value:
+            return None
+        value = self._clean_latex_content(value.strip().strip('"'))
+        return value if value else None
+
     # write a function _extract_bibliography that finds the .bib file in the project files and parses it
     def _extract_bibliography(
         self, latex_content: str, project_files: Optional[Dict[str, str]] = None
@@ -675,10 +1225,8 @@ class LatexExtractor:
         # Parse the first .bib file found
         # If multiple .bib files found, concatenate their contents
         if len(bib_files) > 1:
-            # just concatenate all the files
-            bib_content = ""
-            for bib_file in bib_files:
-                bib_content += project_files[bib_file] + "\n"
+            # join builds the result in one pass, unlike += in a loop
+            bib_content = "\n".join(project_files[bib_file] for bib_file in bib_files)
             logger.info(f"Concatenated {len(bib_files)} .bib files")
         else:
             bib_file = bib_files[0]
@@ -691,30 +1239,16 @@ class LatexExtractor:
 
     def _extract_bibtex_field(self, fields: str, field_name: str) -> Optional[str]:
         """Extract a specific field from BibTeX entry fields."""
-        # Pattern to match field = {value} or field = "value"
+        # Pattern to match field = {value} or field = "value" in one scan
         # Use word boundaries to ensure exact field name match
         # This prevents matching 'paper_title' when looking for 'title'
-        # First try to match with outer braces
-        match = re.search(
-            rf"\b{field_name}\s*=\s*{{((?:[^{{}}]|{{(?:[^{{}}]|{{[^{{}}]*}})*}})*)}}",
-            fields,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if not match:
-            # Try matching with double braces
-            match = re.search(
-                rf'\b{field_name}\s*=\s*{{{{([^{{}}]*(?:{{[^{{}}]*}}[^{{}}"]*)*)}}}}',
-                fields,
-                re.IGNORECASE | re.DOTALL,
-            )
-        if not match:
-            # If no match with braces, try with quotes
-            match = re.search(
-                rf'\b{field_name}\s*=\s*"([^"]*)"', fields, re.IGNORECASE | re.DOTALL
-            )
+        match = _bibtex_field_pattern(field_name).search(fields)
 
         if match:
-            value = match.group(1).strip().strip('"')
+            value = match.group("braced")
+            if value is None:
+                value = match.group("quoted")
+            value = value.strip().strip('"')
             # Clean up LaTeX commands in the value
             value = self._clean_latex_content(value)
             return value
@@ -727,60 +1261,59 @@ class LatexExtractor:
         parent_title: str,
         parent_arxiv_link: str,
         bibliography: Optional[Dict[str, Dict[str, str | None]]] = None,
+        arxiv_prefetch: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> List[CitationData]:
         """Extract citations from a text and look up their details."""
         citations = []
-        seen_citations = set()  # Track seen citations to avoid duplicates
+        # Track seen citation keys to avoid duplicates; the set is per paper
+        # already, so keys need no parent-title prefix, and they are lowered
+        # because LaTeX cite keys are case-insensitive
+        seen_citations = set()
+
+        # LaTeX cite keys are case-insensitive, so lowercase the bibliography
+        # index once here instead of rebuilding it inside every lookup
+        if bibliography:
+            bibliography = {key.lower(): value for key, value in bibliography.items()}
 
         # First, remove LaTeX comments to avoid extracting citations from commented lines
         cleaned_text = self._remove_latex_comments(text)
 
-        # Pattern to match citations like \cite{key1,key2}, \citep{key}, \citet{key}, etc.
-        cite_pattern = r"\\cite[^{}]*\{([^}]+)\}"
-
-        # Also look for inline citations like (Author et al., Year) in cleaned text
-        # cleaned_readable_text = self._clean_latex_content(cleaned_text)
-        inline_pattern = r"\(([^)]*(?:\d{4})[^)]*)\)"
+        # Process \cite{key1,key2}, \citep{key}, \citet{key}, ... references
+        # from comment-free text in one finditer pass
+        cite_found = False
+        for cite_match in _RE_CITE.finditer(cleaned_text):
+            cite_found = True
 
-        # Find all LaTeX citations in comment-free text
-        cite_matches = re.findall(cite_pattern, cleaned_text)
-
-        # Find inline citations in cleaned text
-        inline_matches = re.findall(inline_pattern, cleaned_text)
-
-        logger.info(
-            f"Found {len(cite_matches)} LaTeX citations and {len(inline_matches)} inline citations (after comment removal)"
-        )
-
-        # Process \cite{} references
-        for cite_match in cite_matches:
-            # Split multiple citations
-            cite_keys = [key.strip() for key in cite_match.split(",")]
-
-            for cite_key in cite_keys:
+            for cite_key in cite_match.group(1).split(","):
+                cite_key = cite_key.strip()
                 # Skip if we've already seen this citation key for this paper
-                citation_id = f"{parent_title}::{cite_key}"
+                citation_id = cite_key.lower()
                 if citation_id in seen_citations:
                     continue
                 seen_citations.add(citation_id)
 
-                citation_data = CitationData(
-                    parent_paper_title=parent_title,
-                    parent_arxiv_link=parent_arxiv_link,
-                    citation_shorthand=cite_key,
-                    raw_citation_text=f"\\cite{{{cite_key}}}",
+                citations.append(
+                    CitationData(
+                        parent_paper_title=parent_title,
+                        parent_arxiv_link=parent_arxiv_link,
+                        citation_shorthand=cite_key,
+                        raw_citation_text=f"\\cite{{{cite_key}}}",
+                    )
                 )
 
-                # Try to look up the citation details using bibliography first
-                await self._lookup_citation_details(citation_data, bibliography)
-                citations.append(citation_data)
+        logger.info(
+            f"Found {len(citations)} LaTeX citations (after comment removal)"
+        )
 
-        # Process inline citations (only if we didn't find LaTeX citations)
-        if not cite_matches:
+        # Process inline citations like (Author et al., Year) only if we
+        # didn't find LaTeX citations
+        if not cite_found:
+            inline_matches = _RE_INLINE_CITE.findall(cleaned_text)
             for inline_match in inline_matches:
                 # Simple heuristic: if it contains a year and looks like an author citation
-                if re.search(r"\d{4}", inline_match) and (
-                    "et al" in inline_match.lower() or "," in inline_match
+                inline_lower = inline_match.lower()
+                if _RE_FOUR_DIGITS.search(inline_match) and (
+                    "et al" in inline_lower or "," in inline_match
                 ):
                     # Split multiple citations separated by semicolons
                     individual_citations = [
@@ -789,82 +1322,64 @@ class LatexExtractor:
 
                     for individual_cite in individual_citations:
                         # Ensure each individual citation still looks valid
-                        if re.search(r"\d{4}", individual_cite) and (
-                            "et al" in individual_cite.lower()
+                        citation_id = individual_cite.lower()
+                        if _RE_FOUR_DIGITS.search(individual_cite) and (
+                            "et al" in citation_id
                             or len(individual_cite.split()) >= 2
                         ):
                             # Skip if we've already seen this citation for this paper
-                            citation_id = f"{parent_title}::{individual_cite}"
                             if citation_id in seen_citations:
                                 continue
                             seen_citations.add(citation_id)
 
-                            citation_data = CitationData(
-                                parent_paper_title=parent_title,
-                                parent_arxiv_link=parent_arxiv_link,
-                                citation_shorthand=individual_cite,
-                                raw_citation_text=f"({individual_cite})",
+                            citations.append(
+                                CitationData(
+                                    parent_paper_title=parent_title,
+                                    parent_arxiv_link=parent_arxiv_link,
+                                    citation_shorthand=individual_cite,
+                                    raw_citation_text=f"({individual_cite})",
+                                )
                             )
 
-                            await self._lookup_citation_details(
-                                citation_data, bibliography
-                            )
-                            citations.append(citation_data)
+        # Resolve citation details concurrently once the full set is known.
+        # The lookups are network-bound, so a small bounded fan-out beats
+        # one-at-a-time awaits without hammering the arXiv API.
+        if citations:
+            lookup_semaphore = asyncio.Semaphore(4)
+
+            async def lookup_one(citation: CitationData) -> None:
+                async with lookup_semaphore:
+                    await self._lookup_citation_details(
+                        citation, bibliography, arxiv_prefetch
+                    )
+
+            await asyncio.gather(*(lookup_one(citation) for citation in citations))
 
         logger.info(f"Extracted {len(citations)} unique citations after deduplication")
         return citations
 
     def _remove_latex_comments(self, text: str) -> str:
         """Remove LaTeX comments from text while preserving line structure."""
-        lines = text.split("\n")
-        cleaned_lines = []
-
-        for line in lines:
-            # Find the first unescaped % character
-            # We need to handle escaped % characters (\%)
-            i = 0
-            comment_start = -1
-
-            while i < len(line):
-                if line[i] == "%":
-                    # Check if this % is escaped by counting preceding backslashes
-                    backslash_count = 0
-                    j = i - 1
-                    while j >= 0 and line[j] == "\\":
-                        backslash_count += 1
-                        j -= 1
-
-                    # If even number of backslashes (including 0), the % is not escaped
-                    if backslash_count % 2 == 0:
-                        comment_start = i
-                        break
-                i += 1
-
-            if comment_start >= 0:
-                # Remove everything from the comment character onwards
-                cleaned_line = line[:comment_start].rstrip()
-            else:
-                cleaned_line = line
-
-            cleaned_lines.append(cleaned_line)
-
-        return "\n".join(cleaned_lines)
+        return _RE_UNESCAPED_COMMENT.sub(r"\1", text)
 
     async def _lookup_citation_details(
         self,
         citation: CitationData,
         bibliography: Optional[dict[str, dict[str, str | None]]] = None,
+        arxiv_prefetch: Optional[Dict[str, Dict[str, str]]] = None,
     ):
-        """Look up details for a citation using bibliography and ArXiv API."""
-        # # latex citaitons aren't case sensitive so convert to lower
-        # Convert bibliography keys to lowercase
-        if bibliography:
-            bibliography = {k.lower(): v for k, v in bibliography.items()}
+        """Look up details for a citation using bibliography and ArXiv API.
 
+        ``bibliography`` keys must already be lowercased by the caller; cite
+        keys are case-insensitive and the index is shared across concurrent
+        lookups, so it is normalized once per paper rather than per call.
+        """
         try:
+            shorthand_lower = citation.citation_shorthand.lower()
+
             # First try to find the citation in the bibliography
-            if bibliography and citation.citation_shorthand.lower() in bibliography:
-                bib_entry = bibliography[citation.citation_shorthand.lower()]
+            if bibliography and shorthand_lower in bibliography:
+                bib_entry = bibliography[shorthand_lower]
                 logger.debug(
                     f"Found bibliography entry for '{citation.citation_shorthand}': {bib_entry}"
                 )
@@ -882,6 +1397,40 @@ class LatexExtractor:
                 citation.bib_paper_doi = bib_entry.get("doi")
                 citation.bib_paper_journal = bib_entry.get("journal")
 
+                # Batched id_list prefetch already resolved this entry
+                prefetched = (
+                    arxiv_prefetch.get(shorthand_lower) if arxiv_prefetch else None
+                )
+                if prefetched:
+                    citation.cited_paper_title = prefetched.get("title") or title
+                    citation.cited_paper_arxiv_link = prefetched.get("abs_url") or None
+                    citation.cited_paper_abstract = prefetched.get("abstract")
+                    logger.debug(
+                        f"Used prefetched arXiv entry for '{citation.citation_shorthand}'"
+                    )
+                    return
+
+                # The entry itself already links to arXiv; use it directly
+                # rather than paying a search round-trip
+                url = bib_entry.get("url")
+                if url and "arxiv.org" in url:
+                    citation.cited_paper_arxiv_link = url
+                    logger.debug(
+                        f"Using arXiv URL from bibliography for '{citation.citation_shorthand}'"
+                    )
+                    return
+                doi = bib_entry.get("doi")
+                if doi:
+                    doi_match = _RE_ARXIV_ID_DOI.search(doi)
+                    if doi_match:
+                        citation.cited_paper_arxiv_link = (
+                            f"https://arxiv.org/abs/{doi_match.group(1)}"
+                        )
+                        logger.debug(
+                            f"Built arXiv URL from DOI for '{citation.citation_shorthand}'"
+                        )
+                        return
+
                 if title:
                     # Try to find this paper on ArXiv using the title and authors
                     paper_info = await self._search_arxiv_by_title_authors(
@@ -946,17 +1495,17 @@ class LatexExtractor:
         terms = []
 
         # Extract years (4-digit numbers that look like years)
-        years = re.findall(r"\b(19|20)\d{2}\b", citation_text)
+        years = _RE_YEAR.findall(citation_text)
         if years:
             terms.extend(years)
 
         # Extract author names - common patterns in citation keys
         # Remove year and common suffixes, then extract remaining text
-        cleaned_key = re.sub(r"\b(19|20)\d{2}\b", "", citation_text)  # Remove years
-        cleaned_key = re.sub(r"[^a-zA-Z]", " ", cleaned_key)  # Keep only letters
+        cleaned_key = _RE_YEAR.sub("", citation_text)  # Remove years
+        cleaned_key = _RE_NON_ALPHA.sub(" ", cleaned_key)  # Keep only letters
 
         # Extract words that could be author names (capitalized or all lowercase)
-        potential_authors = re.findall(r"\b[a-zA-Z]{2,}\b", cleaned_key)
+        potential_authors = _RE_WORD2.findall(cleaned_key)
 
         # Take first few potential author names
         terms.extend(potential_authors[:2])
@@ -966,44 +1515,10 @@ class LatexExtractor:
     def _parse_bibliography_entry(
         self, bib_entry: str
     ) -> tuple[Optional[str], Optional[List[str]]]:
-        """Parse a bibliography entry to extract title and authors."""
+        """Parse a free-form bibliography entry to extract title and authors."""
         try:
-            # Common patterns for bibliography entries:
-            # Author, "Title", Journal, Year
-            # Author. Title. Journal. Year.
-            # etc.
-
-            # Try to find quoted title first
-            title_match = re.search(r'["\'\`\{]([^"\'`\}]{10,})["\'\`\}]', bib_entry)
-            if title_match:
-                title = title_match.group(1).strip()
-            else:
-                # Try to find title after author and before journal/venue
-                # This is a heuristic approach
-                parts = re.split(r"[.,;]", bib_entry)
-                title = None
-                for i, part in enumerate(parts):
-                    if len(part.strip()) > 15 and i > 0:  # Likely a title
-                        title = part.strip()
-                        break
-
-            # Extract authors (usually first part before first comma or period)
-            authors = []
-            author_part = (
-                bib_entry.split(",")[0].strip()
-                if "," in bib_entry
-                else bib_entry.split(".")[0].strip()
-            )
-
-            # Split multiple authors
-            if " and " in author_part:
-                authors = [auth.strip() for auth in author_part.split(" and ")]
-            elif "," in author_part and len(author_part.split(",")) <= 3:
-                authors = [auth.strip() for auth in author_part.split(",")]
-            else:
-                authors = [author_part] if author_part else []
-
-            return title, authors if authors else None
+            title, authors = _parse_bib_entry_heuristic(bib_entry)
+            return title, list(authors) if authors else None
 
         except Exception as e:
             logger.debug(f"Error parsing bibliography entry: {e}")
@@ -1012,12 +1527,26 @@ class LatexExtractor:
     async def _search_arxiv_by_title_authors(
         self, title: str, authors: Optional[List[str] | str]
     ) -> Optional[Dict[str, str]]:
-        """Search ArXiv API using title and author information."""
+        """Search ArXiv API using title and author information.
+
+        Memoized per run: bibliography entries from the same group repeat
+        titles and author lists, and misses are as cacheable as hits.
+        """
+        authors_key = tuple(authors) if isinstance(authors, list) else authors
+        cache_key = ("title_authors", title.lower(), authors_key)
+        if cache_key in self._citation_query_cache:
+            return self._citation_query_cache[cache_key]
+
+        result = await self._search_arxiv_by_title_authors_uncached(title, authors)
+        self._citation_query_cache[cache_key] = result
+        return result
+
+    async def _search_arxiv_by_title_authors_uncached(
+        self, title: str, authors: Optional[List[str] | str]
+    ) -> Optional[Dict[str, str]]:
         try:
             # Build search query with title
-            title_words = re.findall(
-                r"\b\w{3,}\b", title.lower()
-            )  # Extract meaningful words
+            title_words = _RE_WORD3.findall(title.lower())  # Extract meaningful words
             title_query = " AND ".join(
                 [f"ti:{word}" for word in title_words[:5]]
             )  # Use first 5 words
@@ -1039,51 +1568,23 @@ class LatexExtractor:
             # Try each query
             for query in queries_to_try:
                 try:
-                    params = {"search_query": query, "start": 0, "max_results": 3}
-
-                    response = requests.get(
-                        "http://export.arxiv.org/api/query", params=params, timeout=10
-                    )
-                    response.raise_for_status()
-
-                    # Parse XML response
-                    import xml.etree.ElementTree as ET
+                    params = {"search_query": query, "start": "0", "max_results": "3"}
 
-                    root = ET.fromstring(response.text)
-                    ns = {"atom": "http://www.w3.org/2005/Atom"}
+                    body = await self._arxiv_api_query(params)
 
-                    entries = root.findall("atom:entry", ns)
-                    if entries:
-                        # Take the first result
-                        entry = entries[0]
-
-                        arxiv_title = entry.find("atom:title", ns)
-                        arxiv_title_text = (
-                            arxiv_title.text.strip()
-                            if arxiv_title is not None and arxiv_title.text is not None
-                            else ""
-                        )
+                    # Stream-parse the Atom response; only the first entry
+                    # is ever inspected here
+                    entry = next(_iter_atom_entries(body), None)
+                    if entry is not None:
+                        parsed = _parse_atom_entry(entry)
+                        arxiv_title_text = parsed["title"]
 
                         # Check if this is a reasonable match
                         if self._titles_match(title, arxiv_title_text):
-                            summary = entry.find("atom:summary", ns)
-                            abstract_text = (
-                                summary.text.strip()
-                                if summary is not None and summary.text is not None
-                                else ""
-                            )
-
-                            # Get ArXiv URL
-                            abs_url = ""
-                            for link in entry.findall("atom:link", ns):
-                                if link.get("rel") == "alternate":
-                                    abs_url = link.get("href", "")
-                                    break
-
                             return {
                                 "title": arxiv_title_text,
-                                "abstract": abstract_text,
-                                "abs_url": abs_url,
+                                "abstract": parsed["abstract"],
+                                "abs_url": parsed["abs_url"],
                             }
 
                 except Exception as search_error:
@@ -1104,14 +1605,14 @@ class LatexExtractor:
             return False
 
         # Simple word overlap check
-        bib_words = set(re.findall(r"\b\w{3,}\b", bib_title.lower()))
-        arxiv_words = set(re.findall(r"\b\w{3,}\b", arxiv_title.lower()))
+        bib_words = _title_words(bib_title)
+        arxiv_words = _title_words(arxiv_title)
 
         if not bib_words or not arxiv_words:
             return False
 
-        overlap = len(bib_words.intersection(arxiv_words))
-        union = len(bib_words.union(arxiv_words))
+        overlap = len(bib_words & arxiv_words)
+        union = len(bib_words | arxiv_words)
 
         similarity = overlap / union if union > 0 else 0
         return similarity >= threshold
@@ -1119,7 +1620,22 @@ class LatexExtractor:
     async def _search_arxiv_for_citation(
         self, search_terms: List[str]
     ) -> Optional[Dict[str, str]]:
-        """Search ArXiv API for a paper based on search terms."""
+        """Search ArXiv API for a paper based on search terms.
+
+        Memoized per run: citation keys sharing author last names build the
+        same queries, so repeats skip the HTTP entirely.
+        """
+        cache_key = ("terms", tuple(sorted(search_terms)))
+        if cache_key in self._citation_query_cache:
+            return self._citation_query_cache[cache_key]
+
+        result = await self._search_arxiv_for_citation_uncached(search_terms)
+        self._citation_query_cache[cache_key] = result
+        return result
+
+    async def _search_arxiv_for_citation_uncached(
+        self, search_terms: List[str]
+    ) -> Optional[Dict[str, str]]:
         try:
             if not search_terms:
                 return None
@@ -1137,6 +1653,12 @@ class LatexExtractor:
                 logger.debug("No meaningful author terms found, skipping search")
                 return None
 
+            # One compiled alternation scans each candidate title for author
+            # terms in C instead of per-term Python substring probes
+            author_re = re.compile(
+                "|".join(re.escape(term.lower()) for term in author_terms)
+            )
+
             # Try different search strategies, but be more restrictive
             queries_to_try = []
 
@@ -1173,59 +1695,29 @@ class LatexExtractor:
                 try:
                     params = {
                         "search_query": query,
-                        "start": 0,
-                        "max_results": 5,  # Get a few more results to check
+                        "start": "0",
+                        "max_results": "5",  # Get a few more results to check
                     }
 
-                    response = requests.get(
-                        "http://export.arxiv.org/api/query", params=params, timeout=10
-                    )
-                    response.raise_for_status()
-
-                    # Parse XML response
-                    import xml.etree.ElementTree as ET
-
-                    root = ET.fromstring(response.text)
-                    ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-                    entries = root.findall("atom:entry", ns)
-                    if entries:
-                        # Check each result for relevance
-                        for entry in entries:
-                            title = entry.find("atom:title", ns)
-                            title_text = (
-                                title.text.strip()
-                                if title is not None and title.text is not None
-                                else ""
-                            )
-
-                            # Basic relevance check: title should contain some of our search terms
-                            if self._is_result_relevant(
-                                title_text, author_terms, year_terms
-                            ):
-                                summary = entry.find("atom:summary", ns)
-                                abstract_text = (
-                                    summary.text.strip()
-                                    if summary is not None and summary.text is not None
-                                    else ""
-                                )
+                    body = await self._arxiv_api_query(params)
 
-                                # Get ArXiv URL
-                                abs_url = ""
-                                for link in entry.findall("atom:link", ns):
-                                    if link.get("rel") == "alternate":
-                                        abs_url = link.get("href", "")
-                                        break
+                    # Stream-parse the Atom response, checking each result
+                    # for relevance as it arrives
+                    for entry in _iter_atom_entries(body):
+                        parsed = _parse_atom_entry(entry)
+                        title_text = parsed["title"]
 
-                                logger.debug(f"Found relevant result: {title_text}")
-                                return {
-                                    "title": title_text,
-                                    "abstract": abstract_text,
-                                    "abs_url": abs_url,
-                                }
+                        # Basic relevance check: title should contain some of our search terms
+                        if self._is_result_relevant(title_text, author_re, year_terms):
+                            logger.debug(f"Found relevant result: {title_text}")
+                            return {
+                                "title": title_text,
+                                "abstract": parsed["abstract"],
+                                "abs_url": parsed["abs_url"],
+                            }
 
-                        # If no relevant results found, log and continue to next query
-                        logger.debug(f"No relevant results found for query: {query}")
+                    # If no relevant results found, log and continue to next query
+                    logger.debug(f"No relevant results found for query: {query}")
 
                 except Exception as search_error:
                     logger.debug(f"Search query '{query}' failed: {search_error}")
@@ -1239,7 +1731,7 @@ class LatexExtractor:
             return None
 
     def _is_result_relevant(
-        self, title: str, author_terms: List[str], year_terms: List[str]
+        self, title: str, author_re: re.Pattern, year_terms: List[str]
     ) -> bool:
         """Check if a search result is relevant to our citation."""
         if not title:
@@ -1248,7 +1740,7 @@ class LatexExtractor:
         title_lower = title.lower()
 
         # Check if title contains any of our author terms (could be in title for some papers)
-        author_in_title = any(term.lower() in title_lower for term in author_terms)
+        author_in_title = bool(author_re.search(title_lower))
 
         # Check if title contains year
         year_in_title = (
@@ -1279,31 +1771,46 @@ class LatexExtractor:
 
             logger.info(f"Downloading PDF for {arxiv_id}")
 
-            # Download the PDF with timeout
-            response = requests.get(
-                pdf_url, timeout=30
-            )  # Reduced from 60 to 30 seconds
-            response.raise_for_status()
-
-            # Check PDF size - skip if too large
-            content_length = len(response.content)
-            if content_length > 50 * 1024 * 1024:  # Skip PDFs larger than 50MB
-                logger.warning(
-                    f"PDF too large ({content_length / 1024 / 1024:.1f}MB), skipping PDF extraction"
-                )
-                return None
-
-            logger.info(f"Downloaded PDF ({content_length / 1024:.1f}KB)")
+            max_pdf_bytes = 50 * 1024 * 1024  # Skip PDFs larger than 50MB
 
             # Create temporary file for PDF
             with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_pdf:
-                temp_pdf.write(response.content)
                 temp_pdf_path = temp_pdf.name
 
             try:
-                # Extract text from PDF with timeout protection
+                # Stream the download to disk in 64KB chunks through the
+                # shared session (30s total timeout), aborting oversized PDFs
+                # mid-transfer instead of buffering the whole body in memory
+                session = await self._get_session()
+                content_length = 0
+                async with session.get(pdf_url) as response:
+                    response.raise_for_status()
+
+                    declared_length = response.content_length
+                    if declared_length is not None and declared_length > max_pdf_bytes:
+                        logger.warning(
+                            f"PDF too large ({declared_length / 1024 / 1024:.1f}MB), skipping PDF extraction"
+                        )
+                        return None
+
+                    with open(temp_pdf_path, "wb") as pdf_file:
+                        async for chunk in response.content.iter_chunked(65536):
+                            content_length += len(chunk)
+                            if content_length > max_pdf_bytes:
+                                logger.warning(
+                                    f"PDF too large (>{max_pdf_bytes / 1024 / 1024:.0f}MB), skipping PDF extraction"
+                                )
+                                return None
+                            pdf_file.write(chunk)
+
+                logger.info(f"Downloaded PDF ({content_length / 1024:.1f}KB)")
+                # Extract text from PDF in a worker thread: PyPDF2 is
+                # CPU-bound and would otherwise stall every concurrent
+                # download sharing the event loop
                 logger.info("Extracting text from PDF...")
-                pdf_text = self._extract_text_from_pdf(temp_pdf_path)
+                pdf_text = await asyncio.to_thread(
+                    self._extract_text_from_pdf, temp_pdf_path
+                )
                 if not pdf_text:
                     logger.warning(f"Could not extract text from PDF for {arxiv_id}")
                     return None
@@ -1330,10 +1837,10 @@ class LatexExtractor:
                 except Exception as e:
                     logger.debug(f"Could not delete temporary PDF file: {e}")
 
-        except requests.Timeout:
+        except asyncio.TimeoutError:
             logger.warning(f"PDF download timed out for {paper.arxiv_id}")
             return None
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.warning(f"PDF download failed for {paper.arxiv_id}: {e}")
             return None
         except Exception as e:
@@ -1387,35 +1894,30 @@ class LatexExtractor:
     def _extract_related_works_from_pdf_text(self, pdf_text: str) -> Optional[str]:
         """Extract related works section from PDF text."""
         try:
-            # Build patterns for section detection in PDF text
-            section_patterns = []
-            for section_name in self.config.related_works_section_names:
-                # Create case-insensitive patterns for PDF text
-                section_patterns.append(section_name.lower())
-
             # Split text into lines and find section boundaries
             lines = pdf_text.split("\n")
 
-            # Find the start of related works section
+            # Find the start of related works section: one compiled scan over
+            # the lowercased text locates candidate section-name occurrences,
+            # and only the lines containing a hit are vetted as headers
             start_idx = None
+            pdf_lower = pdf_text.lower()
 
-            for i, line in enumerate(lines):
-                line_clean = line.strip().lower()
-                for pattern in section_patterns:
-                    if (
-                        pattern in line_clean and len(line_clean) < 100
-                    ):  # Likely a section header
-                        # Check if this is a sentence (letter. Capital letter pattern)
-                        sentence_pattern = re.search(
-                            r"(?:\d*[a-zA-Z]+\d*)+\.\s+[a-zA-Z]", line_clean
-                        )
-                        if sentence_pattern:
-                            continue
+            for match in self._re_pdf_section_name.finditer(pdf_lower):
+                line_start = pdf_lower.rfind("\n", 0, match.start()) + 1
+                line_end = pdf_lower.find("\n", match.end())
+                if line_end == -1:
+                    line_end = len(pdf_lower)
+                line_clean = pdf_lower[line_start:line_end].strip()
 
-                        start_idx = i
-                        break
-                if start_idx is not None:
-                    break
+                if len(line_clean) >= 100:  # Too long for a section header
+                    continue
+                # Check if this is a sentence (letter. Capital letter pattern)
+                if _RE_PDF_SENTENCE.search(line_clean):
+                    continue
+
+                start_idx = pdf_lower.count("\n", 0, line_start)
+                break
 
             if start_idx is None:
                 logger.debug("No related works section found in PDF text")
@@ -1435,15 +1937,10 @@ class LatexExtractor:
 
                 # Check if this line contains a section header anywhere within it
                 # Look for patterns like "text content.3. Section Header" or "text content. 3. Section Header"
-                section_header_match = re.search(
-                    r"\.?\s*(\d+\.?\s+[A-Z](?:[a-z]|[A-Z]|\s+[A-Z])[^.]*?)(?:\s|$)",
-                    line_clean,
-                )
+                section_header_match = _RE_PDF_SECTION_HEADER.search(line_clean)
 
                 # check for a match like 2.1
-                subsection_header_match = re.search(
-                    r"\.?\s*(\d+\.\d+\s+[A-Z](?:[a-z]|[A-Z])[^.]*?)(?:\s|$)", line_clean
-                )
+                subsection_header_match = _RE_PDF_SUBSECTION_HEADER.search(line_clean)
                 if section_header_match and not subsection_header_match:
                     # Found a section header within this line
                     section_header = section_header_match.group(1).strip()
@@ -1472,9 +1969,16 @@ class LatexExtractor:
                     section_content_lines.append(line_clean)
                     continue
 
+                # Headers always start with a digit or an uppercase letter, so
+                # skip the header regexes for any other short line
+                first = line_clean[0]
+                if not (first.isupper() or first.isdigit()):
+                    section_content_lines.append(line_clean)
+                    continue
+
                 # Check for numbered sections at start of line
                 # if re.match(r'^\d+\.?\s+[A-Z][a-z]', line_clean):
-                if re.match(r"^\d+(?!\.\d)\s+[A-Z][a-z]\n", line_clean):
+                if _RE_PDF_NUMBERED_SECTION.match(line_clean):
                     end_idx = i
                     logger.debug(
                         f"Found numbered section header at line {i}: '{line_clean}'"
@@ -1482,29 +1986,8 @@ class LatexExtractor:
                     break
 
                 # Check for clear section header patterns
-                clear_section_patterns = [
-                    r"^methodology?$",
-                    r"^approach?$",
-                    r"^experiments?$",
-                    r"^evaluation$",
-                    r"^results?$",
-                    r"^discussion$",
-                    r"^conclusion$",
-                    r"^conclusions?$",
-                    r"^implementation$",
-                    r"^future work$",
-                    r"^acknowledgments?$",
-                    r"^references?$",
-                    r"^bibliography?$",
-                    r"^appendix$",
-                    r"^limitations?$",
-                    r"^author contributions?$",
-                ]
-
                 line_lower = line_clean.lower()
-                if any(
-                    re.match(pattern, line_lower) for pattern in clear_section_patterns
-                ):
+                if _RE_PDF_CLEAR_SECTION.match(line_lower):
                     end_idx = i
                     logger.debug(
                         f"Found clear section header at line {i}: '{line_clean}'"
@@ -1512,18 +1995,8 @@ class LatexExtractor:
                     break
 
                 # Check for section headers that start with common words
-                section_start_words = [
-                    "method",
-                    "approach",
-                    "experiment",
-                    "evaluation",
-                    "result",
-                    "discussion",
-                    "conclusion",
-                    "implementation",
-                ]
                 if (
-                    any(line_lower.startswith(word) for word in section_start_words)
+                    line_lower.startswith(_SECTION_START_WORDS)
                     and len(line_clean.split()) <= 4
                     and line_clean[0].isupper()
                 ):
@@ -1559,11 +2032,11 @@ class LatexExtractor:
                 return None
 
             # Clean up the text (remove excessive whitespace, fix line breaks)
-            section_content = re.sub(
-                r"\n\s*\n", "\n\n", section_content
+            section_content = _RE_PARAGRAPH_BREAKS.sub(
+                "\n\n", section_content
             )  # Normalize paragraph breaks
-            section_content = re.sub(
-                r"[ \t]+", " ", section_content
+            section_content = _RE_HORIZONTAL_SPACE.sub(
+                " ", section_content
             )  # Normalize spaces
             section_content = section_content.strip()
 
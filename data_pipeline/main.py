@@ -12,10 +12,18 @@ import asyncio
 import logging
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from typing import Dict
 import glob
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 try:
     from argument_parser import parse_args
     from config import PipelineConfig
@@ -38,6 +46,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _isoformat(value) -> str | None:
+    """Render a date as ISO text, passing strings (e.g. from CSV reloads) through."""
+    if isinstance(value, str):
+        return value
+    return value.isoformat() if value else None
+
+
 class DataPipeline:
     """Main data collection pipeline."""
 
@@ -73,21 +88,52 @@ class DataPipeline:
                 f"📄 Step 1: Reading existing papers from {self.config.existing_papers_csv}..."
             )
             papers_df = pd.read_csv(self.config.existing_papers_csv, index_col=0)
+            # Parse the date columns in one vectorized pass and iterate plain
+            # tuples rather than building a Series per row with iterrows
+            published_dates = pd.to_datetime(papers_df["published_date"])
+            updated_dates = pd.to_datetime(papers_df["updated_date"])
+            paper_rows = papers_df.reindex(
+                columns=[
+                    "arxiv_id",
+                    "title",
+                    "authors",
+                    "abstract",
+                    "categories",
+                    "abs_url",
+                    "doi",
+                    "journal_ref",
+                    "comments",
+                ]
+            )
             papers = [
                 ArxivPaper(
-                    arxiv_id=row["arxiv_id"],
-                    title=row["title"],
-                    authors=row["authors"].split("; "),
-                    abstract=row["abstract"],
-                    categories=row["categories"].split("; "),
-                    published_date=pd.to_datetime(row["published_date"]),
-                    updated_date=pd.to_datetime(row["updated_date"]),
-                    abs_url=row["abs_url"],
-                    doi=row.get("doi"),
-                    journal_ref=row.get("journal_ref"),
-                    comments=row.get("comments"),
+                    arxiv_id=arxiv_id,
+                    title=title,
+                    authors=authors.split("; "),
+                    abstract=abstract,
+                    categories=categories.split("; "),
+                    published_date=published_date,
+                    updated_date=updated_date,
+                    abs_url=abs_url,
+                    doi=doi,
+                    journal_ref=journal_ref,
+                    comments=comments,
+                )
+                for (
+                    arxiv_id,
+                    title,
+                    authors,
+                    abstract,
+                    categories,
+                    abs_url,
+                    doi,
+                    journal_ref,
+                    comments,
+                ), published_date, updated_date in zip(
+                    paper_rows.itertuples(index=False, name=None),
+                    published_dates,
+                    updated_dates,
                 )
-                for _, row in papers_df.iterrows()
             ]
         else:
             # Step 1: Scrape ArXiv papers
@@ -108,6 +154,7 @@ class DataPipeline:
         filtered_papers = await self.author_filter.filter_papers_by_author_hindex(
             papers
         )
+        await self.author_filter.close()
 
         if not filtered_papers:
             if not continue_from_failed_test:
@@ -148,6 +195,7 @@ class DataPipeline:
             paper_data_list
         )
         logger.info(f"Extracted {len(citations)} citations total")
+        await self.latex_extractor.close()
 
         # Step 5: Generate all dataframes
         logger.info("📊 Step 5: Generating output dataframes...")
@@ -166,26 +214,34 @@ class DataPipeline:
             try:
                 self._save_dataframes(dataframes, name=timestamp)
             except Exception:
-                import pdb
-
-                pdb.set_trace()
+                logger.exception("Failed to save dataframes")
+                if self.config.fail_fast:
+                    raise
 
         # Step 7: Combine related works
         all_related_works = glob.glob(f"{self.config.output_dir}/related_works/*.csv")
-        dfs = []
-        for file in all_related_works:
-            df = pd.read_csv(file)
-            dfs.append(df)
 
-        # Combine all dataframes
-        combined_df = pd.concat(dfs, ignore_index=True)
+        # Read the per-paper CSVs in parallel — each file is independent and
+        # pandas' C parser releases the GIL — then combine them once
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            dfs = list(executor.map(pd.read_csv, all_related_works))
+        combined_df = pd.concat(dfs, ignore_index=True, copy=False)
         combined_df.to_csv(
             f"{self.config.output_dir}/{timestamp}/related_works_combined.csv",
             index=False,
         )
         papers_df = dataframes["papers"]
-        joined_df = pd.merge(
-            papers_df, combined_df, on=["arxiv_id", "title", "abstract"], how="left"
+        # Join on arxiv_id alone — it already identifies the paper, and merging
+        # on title/abstract as well would hash every long abstract on both sides
+        joined_df = (
+            papers_df.set_index("arxiv_id")
+            .join(
+                combined_df.drop_duplicates("arxiv_id")
+                .set_index("arxiv_id")
+                .drop(columns=["title", "abstract"], errors="ignore"),
+                how="left",
+            )
+            .reset_index()
         )
         joined_df.to_csv(
             f"{self.config.output_dir}/{timestamp}/papers_with_related_works.csv",
@@ -200,139 +256,135 @@ class DataPipeline:
         """Generate all required dataframes."""
         dataframes = {}
 
-        # 1. Papers DataFrame
-        papers_data = []
-        for paper in papers:
-            papers_data.append(
-                {
-                    "arxiv_id": paper.arxiv_id,
-                    "title": paper.title,
-                    "authors": ", ".join(paper.authors),
-                    "abstract": paper.abstract,
-                    "categories": ", ".join(paper.categories),
-                    "published_date": paper.published_date
-                    if isinstance(paper.published_date, str)
-                    else paper.published_date.isoformat()
-                    if paper.published_date
-                    else None,
-                    "updated_date": paper.updated_date
-                    if isinstance(paper.updated_date, str)
-                    else paper.updated_date.isoformat()
-                    if paper.updated_date
-                    else None,
-                    "abs_url": paper.abs_url,
-                }
-            )
+        # 1. Papers DataFrame — one attrgetter tuple per paper, with joins and
+        # date formatting applied column-wise instead of per row
+        paper_columns = [
+            "arxiv_id",
+            "title",
+            "authors",
+            "abstract",
+            "categories",
+            "published_date",
+            "updated_date",
+            "abs_url",
+        ]
+        paper_getter = attrgetter(*paper_columns)
+        papers_df = pd.DataFrame.from_records(
+            [paper_getter(paper) for paper in papers], columns=paper_columns
+        )
+        papers_df["authors"] = papers_df["authors"].map(", ".join)
+        papers_df["categories"] = papers_df["categories"].map(", ".join)
+        papers_df["published_date"] = papers_df["published_date"].map(_isoformat)
+        papers_df["updated_date"] = papers_df["updated_date"].map(_isoformat)
 
-        dataframes["papers"] = pd.DataFrame(papers_data)
+        dataframes["papers"] = papers_df
         logger.info(f"Generated papers dataframe: {len(dataframes['papers'])} rows")
 
         # 2. Paper Content DataFrame
-        content_data = []
-        for paper_data in paper_data_list:
-            content_data.append(
-                {
-                    "arxiv_link": paper_data.arxiv_link,
-                    "arxiv_id": paper_data.arxiv_link.split("/")[-1],
-                    "publication_date": paper_data.publication_date
-                    if isinstance(paper_data.publication_date, str)
-                    else paper_data.publication_date.isoformat()
-                    if paper_data.publication_date
-                    else None,
-                    "paper_title": paper_data.paper_title,
-                    "abstract": paper_data.abstract,
-                    "related_works_section": paper_data.related_works_section,
-                    "related_works_length": len(paper_data.related_works_section)
-                    if paper_data.related_works_section
-                    else 0,
-                }
-            )
+        content_columns = [
+            "arxiv_link",
+            "publication_date",
+            "paper_title",
+            "abstract",
+            "related_works_section",
+            "related_works_length",
+        ]
+        content_getter = attrgetter(*content_columns)
+        content_df = pd.DataFrame.from_records(
+            [content_getter(paper_data) for paper_data in paper_data_list],
+            columns=content_columns,
+        )
+        content_df.insert(
+            1,
+            "arxiv_id",
+            content_df["arxiv_link"].str.rpartition("/", expand=False).str[2],
+        )
+        content_df["publication_date"] = content_df["publication_date"].map(_isoformat)
 
-        dataframes["paper_content"] = pd.DataFrame(content_data)
+        dataframes["paper_content"] = content_df
         logger.info(
             f"Generated paper content dataframe: {len(dataframes['paper_content'])} rows"
         )
 
         # 3. Citations DataFrame
-        citations_data = []
-        for citation in citations:
-            citations_data.append(
-                {
-                    "parent_paper_title": citation.parent_paper_title,
-                    "parent_paper_arxiv_id": citation.parent_arxiv_link.split("/")[-1],
-                    "citation_shorthand": citation.citation_shorthand,
-                    "raw_citation_text": citation.raw_citation_text,
-                    "cited_paper_title": citation.cited_paper_title,
-                    "cited_paper_arxiv_link": citation.cited_paper_arxiv_link,
-                    "cited_paper_abstract": citation.cited_paper_abstract,
-                    "has_metadata": bool(citation.cited_paper_title),
-                    "is_arxiv_paper": bool(
-                        citation.cited_paper_arxiv_link
-                        and "arxiv" in citation.cited_paper_arxiv_link.lower()
-                    ),
-                    "bib_paper_authors": citation.bib_paper_authors
-                    if citation.bib_paper_authors is not None
-                    else None,
-                    "bib_paper_year": citation.bib_paper_year
-                    if citation.bib_paper_year is not None
-                    else None,
-                    "bib_paper_month": citation.bib_paper_month
-                    if citation.bib_paper_month is not None
-                    else None,
-                    "bib_paper_url": citation.bib_paper_url
-                    if citation.bib_paper_url is not None
-                    else None,
-                    "bib_paper_doi": citation.bib_paper_doi
-                    if citation.bib_paper_doi is not None
-                    else None,
-                    "bib_paper_journal": citation.bib_paper_journal
-                    if citation.bib_paper_journal is not None
-                    else None,
-                }
-            )
+        citation_columns = [
+            "parent_paper_title",
+            "parent_arxiv_link",
+            "citation_shorthand",
+            "raw_citation_text",
+            "cited_paper_title",
+            "cited_paper_arxiv_link",
+            "cited_paper_abstract",
+            "bib_paper_authors",
+            "bib_paper_year",
+            "bib_paper_month",
+            "bib_paper_url",
+            "bib_paper_doi",
+            "bib_paper_journal",
+        ]
+        citation_getter = attrgetter(*citation_columns)
+        citations_df = pd.DataFrame.from_records(
+            [citation_getter(citation) for citation in citations],
+            columns=citation_columns,
+        )
+        citations_df.insert(
+            1,
+            "parent_paper_arxiv_id",
+            citations_df.pop("parent_arxiv_link")
+            .str.rpartition("/", expand=False)
+            .str[2],
+        )
+        citations_df.insert(
+            7,
+            "has_metadata",
+            citations_df["cited_paper_title"].notna()
+            & (citations_df["cited_paper_title"] != ""),
+        )
+        citations_df.insert(
+            8,
+            "is_arxiv_paper",
+            citations_df["cited_paper_arxiv_link"]
+            .fillna("")
+            .str.lower()
+            .str.contains("arxiv"),
+        )
+        # The parent columns repeat one value per citation of the same paper;
+        # interning them as categoricals shrinks the frame and lets the stats
+        # groupby below hash small integer codes instead of strings
+        for column in ("parent_paper_title", "parent_paper_arxiv_id"):
+            citations_df[column] = citations_df[column].astype("category")
 
-        dataframes["citations"] = pd.DataFrame(citations_data)
+        dataframes["citations"] = citations_df
         logger.info(
             f"Generated citations dataframe: {len(dataframes['citations'])} rows"
         )
 
-        # 4. Citation Statistics DataFrame
-        stats_data = []
-        for paper_data in paper_data_list:
-            paper_citations = [
-                c for c in citations if c.parent_paper_title == paper_data.paper_title
-            ]
-
-            total_citations = len(paper_citations)
-            resolved_citations = len(
-                [c for c in paper_citations if c.cited_paper_title]
-            )
-            arxiv_citations = len(
-                [
-                    c
-                    for c in paper_citations
-                    if c.cited_paper_arxiv_link
-                    and "arxiv" in c.cited_paper_arxiv_link.lower()
-                ]
-            )
-
-            stats_data.append(
-                {
-                    "paper_title": paper_data.paper_title,
-                    "arxiv_link": paper_data.arxiv_link,
-                    "total_citations": total_citations,
-                    "resolved_citations": resolved_citations,
-                    "resolution_rate": resolved_citations / total_citations
-                    if total_citations > 0
-                    else 0.0,
-                    "arxiv_citations": arxiv_citations,
-                    "arxiv_citation_rate": arxiv_citations / total_citations
-                    if total_citations > 0
-                    else 0.0,
-                }
-            )
-
-        dataframes["citation_stats"] = pd.DataFrame(stats_data)
+        # 4. Citation Statistics DataFrame — aggregate citations once per parent
+        # paper instead of rescanning the citation list for every paper
+        grouped = citations_df.groupby("parent_paper_title", observed=True)
+        total = grouped.size()
+        resolved = grouped["has_metadata"].sum()
+        arxiv_cits = grouped["is_arxiv_paper"].sum()
+
+        stats_df = pd.DataFrame.from_records(
+            [
+                (paper_data.paper_title, paper_data.arxiv_link)
+                for paper_data in paper_data_list
+            ],
+            columns=["paper_title", "arxiv_link"],
+        )
+        titles = stats_df["paper_title"]
+        stats_df["total_citations"] = titles.map(total).fillna(0).astype(int)
+        stats_df["resolved_citations"] = titles.map(resolved).fillna(0).astype(int)
+        stats_df["resolution_rate"] = (
+            stats_df["resolved_citations"] / stats_df["total_citations"]
+        ).where(stats_df["total_citations"] > 0, 0.0)
+        stats_df["arxiv_citations"] = titles.map(arxiv_cits).fillna(0).astype(int)
+        stats_df["arxiv_citation_rate"] = (
+            stats_df["arxiv_citations"] / stats_df["total_citations"]
+        ).where(stats_df["total_citations"] > 0, 0.0)
+
+        dataframes["citation_stats"] = stats_df
         logger.info(
             f"Generated citation statistics dataframe: {len(dataframes['citation_stats'])} rows"
         )
@@ -344,26 +396,26 @@ class DataPipeline:
         dataframes = {}
 
         # Papers DataFrame
-        papers_data = []
-        for paper in papers:
-            papers_data.append(
-                {
-                    "arxiv_id": paper.arxiv_id,
-                    "title": paper.title,
-                    "authors": ", ".join(paper.authors),
-                    "abstract": paper.abstract,
-                    "categories": ", ".join(paper.categories),
-                    "published_date": paper.published_date.isoformat()
-                    if paper.published_date
-                    else None,
-                    "updated_date": paper.updated_date.isoformat()
-                    if paper.updated_date
-                    else None,
-                    "abs_url": paper.abs_url,
-                }
-            )
+        paper_columns = [
+            "arxiv_id",
+            "title",
+            "authors",
+            "abstract",
+            "categories",
+            "published_date",
+            "updated_date",
+            "abs_url",
+        ]
+        paper_getter = attrgetter(*paper_columns)
+        papers_df = pd.DataFrame.from_records(
+            [paper_getter(paper) for paper in papers], columns=paper_columns
+        )
+        papers_df["authors"] = papers_df["authors"].map(", ".join)
+        papers_df["categories"] = papers_df["categories"].map(", ".join)
+        papers_df["published_date"] = papers_df["published_date"].map(_isoformat)
+        papers_df["updated_date"] = papers_df["updated_date"].map(_isoformat)
 
-        dataframes["papers"] = pd.DataFrame(papers_data)
+        dataframes["papers"] = papers_df
         logger.info(f"Generated papers dataframe: {len(dataframes['papers'])} rows")
 
         return dataframes
@@ -373,7 +425,7 @@ class DataPipeline:
     ):
         """Save all dataframes to CSV files."""
         # Create a folder for each paper's data using its arxiv_id
-        arxiv_id = dataframes["paper_content"]["arxiv_link"].iloc[0].split("/")[-1]
+        arxiv_id = dataframes["paper_content"]["arxiv_link"].iloc[0].rpartition("/")[2]
         if name:
             paper_dir = os.path.join(self.config.output_dir, name)
         else:
@@ -393,9 +445,21 @@ class DataPipeline:
                 continue
 
             # filename = f"{name}_{timestamp}.csv"
-            filename = f"{name}.csv"
-            filepath = os.path.join(paper_dir, filename)
-            df.to_csv(filepath, index=False, encoding="utf-8", errors="ignore")
+            if self.config.output_format == "parquet":
+                filepath = os.path.join(paper_dir, f"{name}.parquet")
+                df.to_parquet(filepath, index=False, compression="snappy")
+            else:
+                filepath = os.path.join(paper_dir, f"{name}.csv")
+                # pyarrow's multithreaded writer pays off on large frames; for
+                # small ones the Table conversion overhead dominates
+                if pa is not None and len(df) >= 1000:
+                    pa_csv.write_csv(
+                        pa.Table.from_pandas(df, preserve_index=False), filepath
+                    )
+                else:
+                    df.to_csv(
+                        filepath, index=False, encoding="utf-8", errors="ignore"
+                    )
             logger.info(f"Saved {name} dataframe to {filepath}")
 
     def print_summary(self, dataframes: Dict[str, pd.DataFrame]):
@@ -1,5 +1,6 @@
+import asyncio
+import csv
 import pandas as pd
-import time
 from typing import Dict, List
 from tavily import TavilyClient
 import arxiv
@@ -10,6 +11,17 @@ import argparse
 tavily_client = TavilyClient(os.getenv("TAVILY_API_KEY"))
 arxiv_client = arxiv.Client()
 
+# Deletes the separator characters ignored when comparing titles
+_NORM_TABLE = str.maketrans("", "", " -_")
+
+# How many title lookups may be in flight at once
+_SEARCH_CONCURRENCY = 16
+
+
+def _normalize(title: str) -> str:
+    """Lowercase a title and drop the separators ignored in comparisons."""
+    return title.lower().translate(_NORM_TABLE)
+
 
 @tenacity.retry(
     stop=tenacity.stop_after_attempt(3),
@@ -32,10 +44,14 @@ def search_tavily(title: str) -> Dict[str, str]:
     stop=tenacity.stop_after_attempt(3),
     wait=tenacity.wait_exponential(multiplier=1, min=4, max=10),
 )
-def search_arxiv_api(title: str) -> Dict[str, str] | None:
+def search_arxiv_api(
+    title: str, normalized_title: str | None = None
+) -> Dict[str, str] | None:
     """
     Search arXiv API for a title and return title, url, and content of the first result
     """
+    if normalized_title is None:
+        normalized_title = _normalize(title)
     search = arxiv.Search(
         query=f'ti:"{title}"',  # Search only in title field
         max_results=1,
@@ -44,12 +60,7 @@ def search_arxiv_api(title: str) -> Dict[str, str] | None:
     try:
         # Get first result if any exist
         results = list(arxiv_client.results(search))
-        normalized_result_title = (
-            results[0].title.lower().replace(" ", "").replace("-", "").replace("_", "")
-        )
-        normalized_title = (
-            title.lower().replace(" ", "").replace("-", "").replace("_", "")
-        )
+        normalized_result_title = _normalize(results[0].title)
         if normalized_result_title == normalized_title:
             return {
                 "original_title": title,
@@ -63,16 +74,35 @@ def search_arxiv_api(title: str) -> Dict[str, str] | None:
         return None
 
 
-def save_results(
-    results: List[Dict[str, str]], df: pd.DataFrame, output_file_path: str
-):
+def save_results(results: List[Dict[str, str]], writer: csv.DictWriter, out_file):
     if not results:
         return
-    df_results = pd.DataFrame(results)
-    df_results.to_csv(output_file_path, index=False, mode="a")
+    writer.writerows(results)
+    out_file.flush()
+
 
+async def _search_citation(title: str) -> Dict[str, str] | None:
+    """
+    Look up a title on arXiv, falling back to Tavily, in a worker thread.
+    """
+    # Normalize once, outside the tenacity retries, and skip the arXiv
+    # round-trip for titles that could never pass the exact-match check
+    norm_title = _normalize(title)
+    if len(norm_title) >= 10 and any(c.isalpha() for c in norm_title):
+        api_match = await asyncio.to_thread(search_arxiv_api, title, norm_title)
+        if api_match is not None:
+            print(f"arXiv match found for {title[:50]}...")
+            return api_match
+    print(f"No arXiv match found for {title[:50]}...")
+    api_match = await asyncio.to_thread(search_tavily, title)
+    if api_match is None:
+        print(f"No match found for {title[:50]}...")
+        return None
+    print(f"Tavily match found for {title[:50]}...")
+    return api_match
 
-def process_dataset(csv_file_path: str, output_file_path: str):
+
+async def process_dataset(csv_file_path: str, output_file_path: str):
     """
     Process the dataset and find arXiv matches.
     """
@@ -83,46 +113,83 @@ def process_dataset(csv_file_path: str, output_file_path: str):
     else:
         existing_df = pd.DataFrame(columns=df.columns)
 
+    # Index existing results by title once so each row is a dict lookup
+    # instead of a linear scan plus boolean-mask indexing
+    empty = pd.Series(dtype=object)
+    existing_by_title = {
+        res_title: (search_title, search_url, search_content)
+        for res_title, search_title, search_url, search_content in zip(
+            existing_df["cited_paper_title"],
+            existing_df.get("search_res_title", empty),
+            existing_df.get("search_res_url", empty),
+            existing_df.get("search_res_content", empty),
+        )
+    }
+
+    semaphore = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+    async def lookup_one(index, row) -> Dict[str, str] | None:
+        title = row["cited_paper_title"]
+        print(f"Processing row {index}: {title[:50]}...")
+        async with semaphore:
+            api_match = await _search_citation(title)
+        if api_match is None:
+            return None
+        return {**row.to_dict(), **api_match}
+
+    # Split out rows already present in the output file; only the rest
+    # need network lookups
     results = []
+    pending = []
     for index, row in df.iterrows():
         title = row["cited_paper_title"]  # Assuming 'title' is the column name
-        print(f"Processing row {index}: {title[:50]}...")
-        if title in existing_df["cited_paper_title"].values:
-            existing_row = existing_df[(existing_df["cited_paper_title"] == title)]
+        if title in existing_by_title:
+            search_title, search_url, search_content = existing_by_title[title]
             results.append(
                 {
                     **row.to_dict(),
                     "original_title": title,
-                    "search_res_title": existing_row["search_res_title"].values[0],
-                    "search_res_url": existing_row["search_res_url"].values[0],
-                    "search_res_content": existing_row["search_res_content"].values[0],
+                    "search_res_title": search_title,
+                    "search_res_url": search_url,
+                    "search_res_content": search_content,
                 }
             )
             print(
                 f"Skipping {title[:50]} because it already exists in the output file..."
             )
             continue
-        # Search arXiv API
-        api_match = search_arxiv_api(title)
-        if api_match is None:
-            print(f"No arXiv match found for {title[:50]}...")
-            api_match = search_tavily(title)
-            if api_match is None:
-                print(f"No match found for {title[:50]}...")
-                continue
-            else:
-                print(f"Tavily match found for {title[:50]}...")
-        else:
-            print(f"arXiv match found for {title[:50]}...")
-        results.append({**row.to_dict(), **api_match})
-
-        if index % 100 == 0:
-            save_results(results, df, output_file_path)
+        pending.append((index, row))
+
+    # Append results through one csv writer instead of building a DataFrame
+    # per checkpoint; the header is written only when the file is new
+    fieldnames = list(df.columns) + [
+        column
+        for column in (
+            "original_title",
+            "search_res_title",
+            "search_res_url",
+            "search_res_content",
+        )
+        if column not in df.columns
+    ]
+    new_file = not os.path.exists(output_file_path)
+    with open(output_file_path, "a", newline="") as out_file:
+        writer = csv.DictWriter(out_file, fieldnames=fieldnames)
+        if new_file:
+            writer.writeheader()
+
+        # Run the lookups concurrently in checkpoint-sized batches so partial
+        # progress is saved as before
+        for start in range(0, len(pending), 100):
+            batch = pending[start : start + 100]
+            matches = await asyncio.gather(
+                *(lookup_one(index, row) for index, row in batch)
+            )
+            results.extend(match for match in matches if match is not None)
+            save_results(results, writer, out_file)
             results = []
-        # Add a small delay to be respectful to the API
-        time.sleep(1)
 
-    save_results(results, df, output_file_path)
+        save_results(results, writer, out_file)
 
 
 def deduplicate(df: pd.DataFrame) -> pd.DataFrame:
@@ -143,7 +210,7 @@ if __name__ == "__main__":
     csv_file_path = args.input_file
     output_file_path = args.output_file
 
-    process_dataset(csv_file_path, output_file_path)
+    asyncio.run(process_dataset(csv_file_path, output_file_path))
     # df = pd.read_csv(output_file_path)
     # df = deduplicate(df)
     # df.to_csv(output_file_path, index=False)
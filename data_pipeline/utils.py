@@ -1,10 +1,11 @@
 import pandas as pd
 
 try:
-    from arxiv_scraper import ArxivPaper
+    from arxiv_scraper import ArxivPaper, clean_author_name
 except ImportError:
-    from .arxiv_scraper import ArxivPaper
-import re
+    from .arxiv_scraper import ArxivPaper, clean_author_name
+
+__all__ = ["papers_to_dataframe", "clean_author_name"]
 
 
 def papers_to_dataframe(papers: list[ArxivPaper] | ArxivPaper) -> pd.DataFrame:
@@ -20,31 +21,45 @@ def papers_to_dataframe(papers: list[ArxivPaper] | ArxivPaper) -> pd.DataFrame:
     if isinstance(papers, ArxivPaper):
         papers = [papers]
 
-    paper_dicts = [
+    # Build one list per column instead of one dict per paper, so the
+    # DataFrame constructor consumes ready-made columns directly
+    arxiv_ids = []
+    titles = []
+    authors = []
+    abstracts = []
+    categories = []
+    published_dates = []
+    updated_dates = []
+    abs_urls = []
+    dois = []
+    journal_refs = []
+    comments = []
+    for paper in papers:
+        arxiv_ids.append(paper.arxiv_id)
+        titles.append(paper.title)
+        authors.append("; ".join(paper.authors))
+        abstracts.append(paper.abstract)
+        categories.append("; ".join(paper.categories))
+        published_dates.append(paper.published_date)
+        updated_dates.append(paper.updated_date)
+        abs_urls.append(paper.abs_url)
+        dois.append(paper.doi)
+        journal_refs.append(paper.journal_ref)
+        comments.append(paper.comments)
+
+    return pd.DataFrame(
         {
-            "arxiv_id": paper.arxiv_id,
-            "title": paper.title,
-            "authors": "; ".join(paper.authors),
-            "abstract": paper.abstract,
-            "categories": "; ".join(paper.categories),
-            "published_date": paper.published_date,
-            "updated_date": paper.updated_date,
-            "abs_url": paper.abs_url,
-            "doi": paper.doi,
-            "journal_ref": paper.journal_ref,
-            "comments": paper.comments,
-        }
-        for paper in papers
-    ]
-
-    return pd.DataFrame(paper_dicts)
-
-
-def clean_author_name(name: str) -> str:
-    """Clean and normalize author name for lookups."""
-    cleaned = re.sub(r"\s+", " ", name.strip())
-    prefixes = ["Dr.", "Prof.", "Professor", "Dr", "Prof"]
-    for prefix in prefixes:
-        if cleaned.startswith(prefix):
-            cleaned = cleaned[len(prefix) :].strip()
-    return cleaned
+            "arxiv_id": arxiv_ids,
+            "title": titles,
+            "authors": authors,
+            "abstract": abstracts,
+            "categories": categories,
+            "published_date": published_dates,
+            "updated_date": updated_dates,
+            "abs_url": abs_urls,
+            "doi": dois,
+            "journal_ref": journal_refs,
+            "comments": comments,
+        },
+        copy=False,
+    )
@@ -1,7 +1,6 @@
 import pandas as pd
-import re
-from nltk.tokenize import sent_tokenize
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from evaluator import Evaluator
@@ -14,30 +13,36 @@ except ImportError:
     from .enum import EvaluationFunction
     from ..prompts.support import get_support
 
+# How many support judgements may be in flight at once
+_SUPPORT_CONCURRENCY = 32
+
 
 class CitePEvaluator(Evaluator):
     evaluation_function = EvaluationFunction.CITE_P
 
     def _calculate(self, parser: Parser) -> pd.DataFrame:
-        sentences = custom_sent_tokenize(parser.clean_text)
-        citation_pecision = []
-        for sent in sentences:
-            if len(sent) < 50:
+        # Collect every (document, claim) pair first, then score them all
+        # concurrently; pair_counts records how many pairs each kept
+        # sentence contributed so precision can be reassembled in order
+        pairs = []
+        pair_counts = []
+        for sentence in parser.parsed_sentences:
+            if len(sentence.raw) < 50:
                 continue
-            correct_citations = []
-            target = _remove_citations(sent)
-            ref = [int(x[1:]) - 1 for x in re.findall(r"\[\d+", sent)]
-            for r in ref:
-                if r > len(parser.docs) - 1 or r < 0:
-                    continue
+            count = 0
+            for r in sentence.refs:
                 current_doc = _format_document(parser.citations_for_cite_quality[r])
-                single_entail = get_support(current_doc, target)
-                correct_citations.append(single_entail)
-            precision = (
-                sum(correct_citations) / len(correct_citations)
-                if correct_citations
-                else 0
-            )
+                pairs.append((current_doc, sentence.stripped))
+                count += 1
+            pair_counts.append(count)
+
+        supports = _get_support_batch(pairs)
+        citation_pecision = []
+        position = 0
+        for count in pair_counts:
+            correct_citations = supports[position : position + count]
+            position += count
+            precision = sum(correct_citations) / count if count else 0
             citation_pecision.append(precision)
         return np.mean(citation_pecision)
 
@@ -45,23 +50,17 @@ class CitePEvaluator(Evaluator):
         return pd.DataFrame(
             {
                 "folder_path": [parser.folder_path for parser in parsers],
-                self.evaluation_function.value: [
-                    self._calculate(parser) for parser in parsers
-                ],
+                self.evaluation_function.value: self._parallel_calculate(parsers),
             }
         )
 
 
-def custom_sent_tokenize(text):
-    protected_text = text
-    protected_text = re.sub(r"\bet al\.", "ET_AL_PLACEHOLDER", protected_text)
-    sentences = sent_tokenize(protected_text)
-    sentences = [s.replace("ET_AL_PLACEHOLDER", "et al.") for s in sentences]
-    return sentences
-
-
-def _remove_citations(text: str) -> str:
-    return re.sub(r"\s*\[\d+\]", "", text).replace(" |", "").strip()
+def _get_support_batch(pairs: list[tuple[str, str]]) -> list[int]:
+    """Score (document, claim) pairs concurrently, preserving order."""
+    if not pairs:
+        return []
+    with ThreadPoolExecutor(max_workers=_SUPPORT_CONCURRENCY) as executor:
+        return list(executor.map(lambda pair: get_support(*pair), pairs))
 
 
 def _format_document(doc: tuple[str, str]) -> str:
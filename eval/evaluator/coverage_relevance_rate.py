@@ -70,8 +70,6 @@ class CoverageRelevanceRateEvaluator(Evaluator):
         return pd.DataFrame(
             {
                 "folder_path": [parser.folder_path for parser in parsers],
-                self.evaluation_function.value: [
-                    self._calculate(parser) for parser in parsers
-                ],
+                self.evaluation_function.value: self._parallel_calculate(parsers),
             }
         )
@@ -1,42 +1,58 @@
+import asyncio
 import pandas as pd
-import re
-import time
 import numpy as np
+import aiohttp
 
 try:
     from evaluator import Evaluator
     from parsers import Parser
     from evaluator import EvaluationFunction
-    from utils import get_citation_count_from_title
+    from utils import get_citation_count_from_title_async
 except ImportError:
     from .evaluator import Evaluator
     from ..parsers import Parser
     from .enum import EvaluationFunction
-    from ..utils import get_citation_count_from_title
+    from ..utils import get_citation_count_from_title_async
+
+# How many OpenAlex lookups may be in flight at once
+_FETCH_CONCURRENCY = 8
 
 
 class DocumentImportanceEvaluator(Evaluator):
     evaluation_function = EvaluationFunction.DOCUMENT_IMPORTANCE
 
     def _calculate(self, parser: Parser) -> float:
-        citations = [
-            re.sub(r"[^\w\s]", "", doc["title"].lower()).strip() for doc in parser.docs
-        ]
-        citations = list(set([citation for citation in citations if citation]))
-        results = []
-        for i, citation in enumerate(citations):
-            time.sleep(0.05)  # Rate limiting
-            count = get_citation_count_from_title(citation)
-            if count is not None:
-                results.append(count)
+        # Normalize and dedupe all titles in one vectorized pass
+        titles = pd.Series([doc["title"] for doc in parser.docs], dtype=object)
+        normalized = (
+            titles.str.lower().str.replace(r"[^\w\s]", "", regex=True).str.strip()
+        )
+        citations = normalized[normalized != ""].drop_duplicates().tolist()
+        results = asyncio.run(self._fetch_citation_counts(citations))
         return np.median(results) if results else 0
 
+    async def _fetch_citation_counts(self, citations: list[str]) -> list[int]:
+        # Concurrent lookups behind a semaphore replace the old serial loop
+        # with a flat 50ms sleep per citation
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+        async with aiohttp.ClientSession() as session:
+
+            async def fetch(citation: str):
+                async with semaphore:
+                    return await get_citation_count_from_title_async(
+                        session, citation
+                    )
+
+            counts = await asyncio.gather(
+                *(fetch(citation) for citation in citations)
+            )
+        return [count for count in counts if count is not None]
+
     def calculate(self, parsers: list[Parser]) -> pd.DataFrame:
         return pd.DataFrame(
             {
                 "folder_path": [parser.folder_path for parser in parsers],
-                self.evaluation_function.value: [
-                    self._calculate(parser) for parser in parsers
-                ],
+                self.evaluation_function.value: self._parallel_calculate(parsers),
             }
         )
@@ -1,6 +1,7 @@
 import pandas as pd
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from parsers import Parser
@@ -22,6 +23,20 @@ class Evaluator(ABC):
     def calculate(self, parsers: list[Parser]) -> pd.DataFrame:
         pass
 
+    def _parallel_calculate(
+        self, parsers: list[Parser], calculate_one=None, max_workers: int = 8
+    ) -> list:
+        """Score parsers concurrently with threads, preserving input order.
+
+        Intended for I/O-bound evaluators whose per-parser work is dominated
+        by LLM or HTTP round-trips.
+        """
+        calculate_one = calculate_one or self._calculate
+        if len(parsers) <= 1:
+            return [calculate_one(parser) for parser in parsers]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(calculate_one, parsers))
+
     @classmethod
     def aggregate(cls, key_to_df: dict[str, pd.DataFrame]) -> pd.DataFrame:
         results = []
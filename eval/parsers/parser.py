@@ -1,11 +1,47 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import NamedTuple
+import os
 import pandas as pd
+import re
 
 try:
     from parsers.parser_type import ParserType
 except ImportError:
     from ..parsers.parser_type import ParserType
 
+_RE_ET_AL = re.compile(r"\bet al\.")
+_RE_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z\[])")
+_RE_CITATION = re.compile(r"\s*\[\d+\]")
+_RE_REF = re.compile(r"\[\d+")
+
+
+class ParsedSentence(NamedTuple):
+    """One sentence of clean_text with its citation-free form and refs."""
+
+    raw: str
+    stripped: str
+    refs: tuple[int, ...]
+
+
+# Set DEEPSCHOLAR_SENT_TOKENIZER=nltk to opt back into NLTK's Punkt
+# tokenizer (requires nltk and its punkt models to be installed)
+_SENT_TOKENIZER = os.getenv("DEEPSCHOLAR_SENT_TOKENIZER", "regex")
+
+
+def custom_sent_tokenize(text):
+    if _SENT_TOKENIZER == "nltk":
+        from nltk.tokenize import sent_tokenize
+
+        return sent_tokenize(text)
+    protected_text = _RE_ET_AL.sub("ET_AL_PLACEHOLDER", text)
+    sentences = _RE_SENT_SPLIT.split(protected_text)
+    return [s.replace("ET_AL_PLACEHOLDER", "et al.") for s in sentences]
+
+
+def _remove_citations(text: str) -> str:
+    return _RE_CITATION.sub("", text).replace(" |", "").strip()
+
 
 class Parser(ABC):
     parser_type: ParserType
@@ -54,6 +90,20 @@ class Parser(ABC):
     def _load_file(self):
         pass
 
+    @cached_property
+    def parsed_sentences(self) -> list[ParsedSentence]:
+        """Tokenize clean_text once; shared by the citation evaluators."""
+        doc_count = len(self.docs or [])
+        parsed = []
+        for sent in custom_sent_tokenize(self.clean_text or ""):
+            refs = tuple(
+                ref
+                for ref in (int(x[1:]) - 1 for x in _RE_REF.findall(sent))
+                if 0 <= ref < doc_count
+            )
+            parsed.append(ParsedSentence(sent, _remove_citations(sent), refs))
+        return parsed
+
     def get_folder_info(
         self, include_related_works_section: bool = True
     ) -> dict[str, str]:
@@ -1,7 +1,9 @@
 import lotus
 import re
+from functools import lru_cache
 
 
+@lru_cache(maxsize=100_000)
 def get_support(premise: str, hypothesis: str) -> int:
     system_prompt = "You are an intelligent and fair evaluator."
     user_prompt = "You are an Attribution Validator. Your task is to verify whether a given reference can support the given claim.\n\n"
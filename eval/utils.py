@@ -1,3 +1,4 @@
+import aiohttp
 import pandas as pd
 import re
 import requests  # type: ignore
@@ -79,6 +80,37 @@ def get_citation_count_from_title(
         return None
 
 
+async def get_citation_count_from_title_async(
+    session: aiohttp.ClientSession,
+    title,
+    mailto="your@email.com",
+    similarity_threshold=0.8,
+):
+    try:
+        search_url = f"https://api.openalex.org/works?search={title}&mailto={mailto}"
+        async with session.get(
+            search_url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json()
+        results = payload.get("results", [])
+
+        if results:
+            top_result = results[0]
+            paper_title = top_result.get("display_name", "")
+            citation_count = top_result.get("cited_by_count", 0)
+
+            # Compare similarity
+            similarity = jaccard_similarity(title, paper_title)
+            if similarity >= similarity_threshold:
+                return citation_count
+            else:
+                return None
+    except Exception as e:
+        print(f"Error fetching citation count: {e}")
+        return None
+
+
 # === Get valid arXiv links and mapped IDs ===
 def get_valid_arxiv_links_and_ids(id_map_path: str, paper_content_path: str):
     id_map_df = pd.read_csv(id_map_path, dtype={"arxiv_id": str})
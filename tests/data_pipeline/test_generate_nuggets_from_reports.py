@@ -0,0 +1,98 @@
+"""
+Unit tests for the batched nuggetizer runner in generate_nuggets_from_reports.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("nuggetizer")
+
+from nuggetizer.core.types import Query, Document, Request
+
+from data_pipeline.generate_nuggets_from_reports import _run_nuggetizer_batched
+
+
+def _make_request(qid: str) -> Request:
+    query = Query(qid=qid, text=f"query for {qid}")
+    documents = [Document(docid=f"{qid}_related_works", segment=f"context for {qid}")]
+    return Request(query=query, documents=documents)
+
+
+class ReleasedApiNuggetizer:
+    """Stub matching released nuggetizer builds: ``async def create/assign``."""
+
+    async def create(self, request):
+        return [f"nugget:{request.query.qid}"]
+
+    async def assign(self, query, context, nuggets):
+        return [f"assigned:{context}:{nugget}" for nugget in nuggets]
+
+
+class VendoredApiNuggetizer:
+    """Stub matching the in-tree eval/nuggetizer package: coroutines under
+    ``async_create``/``async_assign`` plus blocking wrappers under the
+    released names."""
+
+    async def async_create(self, request):
+        return [f"nugget:{request.query.qid}"]
+
+    async def async_assign(self, query, context, nuggets):
+        return [f"assigned:{context}:{nugget}" for nugget in nuggets]
+
+    def create(self, request):
+        raise AssertionError("blocking create() must not be called")
+
+    def assign(self, query, context, nuggets):
+        raise AssertionError("blocking assign() must not be called")
+
+
+class FailingCreateNuggetizer(ReleasedApiNuggetizer):
+    """Released-API stub whose create call fails for one paper."""
+
+    async def create(self, request):
+        if request.query.qid == "bad":
+            raise RuntimeError("LLM call failed")
+        return await super().create(request)
+
+    async def assign(self, query, context, nuggets):
+        assert not isinstance(nuggets, Exception), (
+            "assign must not run for papers whose create failed"
+        )
+        return await super().assign(query, context, nuggets)
+
+
+@pytest.mark.parametrize(
+    "nuggetizer_cls", [ReleasedApiNuggetizer, VendoredApiNuggetizer]
+)
+def test_run_nuggetizer_batched_supports_both_apis(nuggetizer_cls):
+    """Both the released and the in-tree method names should be driven."""
+    requests = [_make_request("2501.00001"), _make_request("2501.00002")]
+    contexts = ["ctx1", "ctx2"]
+
+    scored_lists, assigned_lists = asyncio.run(
+        _run_nuggetizer_batched(nuggetizer_cls(), requests, contexts, concurrency=2)
+    )
+
+    assert scored_lists == [["nugget:2501.00001"], ["nugget:2501.00002"]]
+    assert assigned_lists == [
+        ["assigned:ctx1:nugget:2501.00001"],
+        ["assigned:ctx2:nugget:2501.00002"],
+    ]
+
+
+def test_run_nuggetizer_batched_passes_create_failures_through():
+    """A failed create should surface as the exception, not abort the batch."""
+    requests = [_make_request("good"), _make_request("bad")]
+    contexts = ["ctx-good", "ctx-bad"]
+
+    scored_lists, assigned_lists = asyncio.run(
+        _run_nuggetizer_batched(
+            FailingCreateNuggetizer(), requests, contexts, concurrency=2
+        )
+    )
+
+    assert scored_lists[0] == ["nugget:good"]
+    assert isinstance(scored_lists[1], RuntimeError)
+    assert assigned_lists[0] == ["assigned:ctx-good:nugget:good"]
+    assert assigned_lists[1] is scored_lists[1]
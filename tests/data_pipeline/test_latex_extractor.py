@@ -2,9 +2,13 @@
 Unit tests for the LatexExtractor module.
 """
 
+import asyncio
+import json
+import os
+
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from data_pipeline.latex_extractor import LatexExtractor, PaperData, CitationData
 from data_pipeline.config import PipelineConfig
@@ -18,8 +22,29 @@ logger = logging.getLogger(__name__)
 pytestmark = pytest.mark.asyncio
 
 
+def _mock_http_session(body: bytes) -> MagicMock:
+    """Build a mock aiohttp session whose GETs return the given body."""
+
+    async def _chunks(_chunk_size):
+        yield body
+
+    response = Mock()
+    response.status = 200
+    response.headers = {
+        "ETag": '"test-etag"',
+        "Last-Modified": "Wed, 15 Jan 2025 12:00:00 GMT",
+    }
+    response.raise_for_status.return_value = None
+    response.read = AsyncMock(return_value=body)
+    response.content_length = len(body)
+    response.content.iter_chunked = _chunks
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = response
+    return session
+
+
 @pytest.fixture
-def sample_config():
+def sample_config(tmp_path):
     """Create a sample configuration for testing."""
     return PipelineConfig(
         start_date=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
@@ -33,7 +58,7 @@ def sample_config():
             "Background",
             "Literature Review",
         ],
-        output_dir="./test_output",
+        output_dir=str(tmp_path / "outputs"),
     )
 
 
@@ -244,16 +269,21 @@ This is the methodology section.
 
         assert result is None
 
-    @patch("data_pipeline.latex_extractor.requests.get")
+    @patch(
+        "data_pipeline.latex_extractor.LatexExtractor._get_session",
+        new_callable=AsyncMock,
+    )
     @patch("data_pipeline.latex_extractor.tarfile.open")
     @patch("data_pipeline.latex_extractor.LatexExtractor._find_main_tex_file")
-    @patch("data_pipeline.latex_extractor.LatexExtractor._read_all_project_files")
+    @patch(
+        "data_pipeline.latex_extractor.LatexExtractor._read_project_files_from_tar"
+    )
     async def test_download_latex_source_success(
         self,
         mock_read_files,
         mock_find_tex,
         mock_tar,
-        mock_get,
+        mock_get_session,
         sample_config,
         sample_papers,
     ):
@@ -261,12 +291,9 @@ This is the methodology section.
         extractor = LatexExtractor(sample_config)
 
         # Mock successful download
-        mock_response = Mock()
-        mock_response.content = b"tar.gz content"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get_session.return_value = _mock_http_session(b"tar.gz content")
 
-        # Mock tar extraction
+        # Mock in-memory tar parsing
         mock_tar_context = Mock()
         mock_tar.return_value.__enter__.return_value = mock_tar_context
         mock_tar.return_value.__exit__.return_value = None
@@ -286,7 +313,25 @@ This is the methodology section.
             "file2.bib": "content2",
         }
 
-    @patch("data_pipeline.latex_extractor.requests.get")
+        # The background cache write must leave a complete tarball and a
+        # parseable validator sidecar behind
+        await asyncio.gather(*extractor._pending_cache_writes)
+        archive_path = os.path.join(
+            sample_config.output_dir, "latex_source", "2501.00677v1.tar.gz"
+        )
+        with open(archive_path, "rb") as f:
+            assert f.read() == b"tar.gz content"
+        with open(archive_path + ".meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        assert meta == {
+            "etag": '"test-etag"',
+            "last_modified": "Wed, 15 Jan 2025 12:00:00 GMT",
+        }
+
+    @patch(
+        "data_pipeline.latex_extractor.LatexExtractor._get_session",
+        new_callable=AsyncMock,
+    )
     @patch("data_pipeline.latex_extractor.LatexExtractor._extract_text_from_pdf")
     @patch(
         "data_pipeline.latex_extractor.LatexExtractor._extract_related_works_from_pdf_text"
@@ -295,7 +340,7 @@ This is the methodology section.
         self,
         mock_extract_pdf_text,
         mock_extract_text,
-        mock_get,
+        mock_get_session,
         sample_config,
         sample_papers,
         sample_pdf_text,
@@ -304,10 +349,7 @@ This is the methodology section.
         extractor = LatexExtractor(sample_config)
 
         # Mock successful PDF download
-        mock_response = Mock()
-        mock_response.content = b"pdf content"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get_session.return_value = _mock_http_session(b"pdf content")
 
         # Mock text extraction
         mock_extract_text.return_value = sample_pdf_text